@@ -58,10 +58,10 @@ function(hydrogen_configure_gcc_optimizations)
         add_compile_options(-march=native -mtune=native)
     endif()
     
-    # Enable link-time optimization if requested
+    # Enable link-time optimization if requested (parallel LTRANS, like ThinLTO)
     if(HYDROGEN_ENABLE_LTO)
-        add_compile_options(-flto)
-        add_link_options(-flto)
+        add_compile_options(-flto=auto)
+        add_link_options(-flto=auto)
     endif()
     
     # Memory optimization for large builds
@@ -228,7 +228,7 @@ function(hydrogen_configure_unity_build target_name)
     if(CMAKE_VERSION VERSION_GREATER_EQUAL "3.16" AND HYDROGEN_ENABLE_UNITY_BUILD)
         set_target_properties(${target_name} PROPERTIES
             UNITY_BUILD ON
-            UNITY_BUILD_BATCH_SIZE 8
+            UNITY_BUILD_BATCH_SIZE ${HYDROGEN_UNITY_BUILD_BATCH_SIZE}
         )
         
         message(STATUS "Hydrogen: Unity build enabled for ${target_name}")
@@ -348,6 +348,7 @@ endfunction()
 
 # Define optimization options
 option(HYDROGEN_ENABLE_UNITY_BUILD "Enable unity builds for faster compilation" OFF)
+set(HYDROGEN_UNITY_BUILD_BATCH_SIZE 8 CACHE STRING "Number of sources combined per unity build file")
 option(HYDROGEN_ENABLE_BUILD_OPTIMIZATIONS "Enable comprehensive build optimizations" ON)
 option(HYDROGEN_ENABLE_CCACHE "Enable ccache for compilation caching" ON)
 option(HYDROGEN_MONITOR_BUILD_PERFORMANCE "Monitor and report build performance" OFF)
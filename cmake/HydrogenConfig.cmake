@@ -45,8 +45,10 @@ option(HYDROGEN_ENABLE_LTO "Enable Link Time Optimization in Release builds" OFF
 
 # Feature options
 option(HYDROGEN_ENABLE_PYTHON_BINDINGS "Build Python bindings" OFF)
+option(HYDROGEN_BINDINGS_OPT_SIZE "Optimize the Python bindings module for size instead of speed" ON)
 option(HYDROGEN_ENABLE_SSL "Enable SSL/TLS support" ON)
 option(HYDROGEN_ENABLE_COMPRESSION "Enable compression support" ON)
+option(HYDROGEN_ENABLE_IO_URING "Use io_uring instead of epoll for Asio sockets (Linux only)" OFF)
 option(HYDROGEN_ENABLE_LOGGING "Enable detailed logging" ON)
 option(HYDROGEN_ENABLE_BASE64 "Enable base64 encoding support (legacy)" OFF)
 option(HYDROGEN_ENABLE_PROFILING "Enable profiling support" OFF)
@@ -56,6 +58,7 @@ option(HYDROGEN_PREFER_VCPKG "Prefer vcpkg over other package managers" OFF)
 option(HYDROGEN_PREFER_CONAN "Prefer Conan over other package managers" OFF)
 option(HYDROGEN_DISABLE_VCPKG "Disable vcpkg package manager completely" OFF)
 option(HYDROGEN_ALLOW_FETCHCONTENT "Allow FetchContent fallback for missing packages" ON)
+option(HYDROGEN_FETCH_SHALLOW "Use shallow git clones for FetchContent dependencies" ON)
 
 # =============================================================================
 # Feature Detection and Configuration
@@ -98,6 +101,28 @@ function(hydrogen_configure_features)
         message(STATUS "Hydrogen: Compression support disabled")
     endif()
     
+    # io_uring Feature (Linux only)
+    # Asio selects its reactor at compile time, so the definitions must be
+    # identical for every translation unit; they are applied directory-wide.
+    if(HYDROGEN_ENABLE_IO_URING)
+        find_package(PkgConfig QUIET)
+        if(PkgConfig_FOUND)
+            pkg_check_modules(LIBURING QUIET IMPORTED_TARGET GLOBAL liburing)
+        endif()
+        if(CMAKE_SYSTEM_NAME STREQUAL "Linux" AND LIBURING_FOUND)
+            set(HYDROGEN_HAS_IO_URING TRUE CACHE BOOL "io_uring support available")
+            add_compile_definitions(BOOST_ASIO_HAS_IO_URING BOOST_ASIO_DISABLE_EPOLL)
+            link_libraries(PkgConfig::LIBURING)
+            message(STATUS "Hydrogen: io_uring transport enabled (liburing ${LIBURING_VERSION})")
+        else()
+            set(HYDROGEN_HAS_IO_URING FALSE CACHE BOOL "io_uring support available")
+            message(WARNING "Hydrogen: io_uring requested but liburing not found or not on Linux, using epoll")
+        endif()
+    else()
+        set(HYDROGEN_HAS_IO_URING FALSE CACHE BOOL "io_uring support available")
+        message(STATUS "Hydrogen: io_uring transport disabled")
+    endif()
+    
     # Base64 Feature (Legacy)
     if(HYDROGEN_ENABLE_BASE64)
         set(HYDROGEN_HAS_BASE64 TRUE CACHE BOOL "Base64 encoding support available")
@@ -273,6 +298,7 @@ function(hydrogen_print_configuration_summary)
     message(STATUS "  Python bindings: ${HYDROGEN_ENABLE_PYTHON_BINDINGS}")
     message(STATUS "  SSL support: ${HYDROGEN_ENABLE_SSL}")
     message(STATUS "  Compression: ${HYDROGEN_ENABLE_COMPRESSION}")
+    message(STATUS "  io_uring transport: ${HYDROGEN_HAS_IO_URING}")
     message(STATUS "  Base64 support: ${HYDROGEN_ENABLE_BASE64}")
     message(STATUS "  Logging: ${HYDROGEN_ENABLE_LOGGING}")
     message(STATUS "")
@@ -286,6 +312,7 @@ function(hydrogen_print_configuration_summary)
     message(STATUS "Package Management:")
     message(STATUS "  Primary manager: ${HYDROGEN_PRIMARY_PACKAGE_MANAGER}")
     message(STATUS "  FetchContent fallback: ${HYDROGEN_ALLOW_FETCHCONTENT}")
+    message(STATUS "  Shallow fetches: ${HYDROGEN_FETCH_SHALLOW}")
     message(STATUS "===========================================")
     message(STATUS "")
 endfunction()
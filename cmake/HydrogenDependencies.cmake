@@ -153,10 +153,16 @@ function(hydrogen_find_with_fetchcontent package_name package_config)
             string(TOLOWER ${cmake_name} package_lower)
             set(cache_dir "${FETCHCONTENT_BASE_DIR}/${package_lower}-${git_tag}")
 
+            set(shallow_args)
+            if(HYDROGEN_FETCH_SHALLOW)
+                set(shallow_args GIT_SHALLOW TRUE)
+            endif()
+
             FetchContent_Declare(
                 ${package_lower}
                 GIT_REPOSITORY ${git_url}
                 GIT_TAG ${git_tag}
+                ${shallow_args}
                 SOURCE_DIR ${cache_dir}
             )
 
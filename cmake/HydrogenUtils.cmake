@@ -103,6 +103,9 @@ function(hydrogen_find_package package_name)
         if(ARG_FALLBACK_TAG)
             list(APPEND fetch_args GIT_TAG ${ARG_FALLBACK_TAG})
         endif()
+        if(HYDROGEN_FETCH_SHALLOW AND ARG_FALLBACK_URL)
+            list(APPEND fetch_args GIT_SHALLOW TRUE)
+        endif()
         if(ARG_FALLBACK_DIR)
             list(APPEND fetch_args SOURCE_DIR ${ARG_FALLBACK_DIR})
         endif()
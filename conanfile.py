@@ -15,6 +15,7 @@ class HydrogenConan(ConanFile):
     topics = ("astronomy", "device-communication", "protocol", "framework")
     
     # Package configuration
+    package_type = "library"
     settings = "os", "compiler", "build_type", "arch"
     options = {
         "shared": [True, False],
@@ -28,6 +29,8 @@ class HydrogenConan(ConanFile):
         "with_grpc": [True, False],
         "with_zeromq": [True, False],
         "with_mqtt": [True, False],
+        "with_ccache": [True, False],
+        "python_gil_free": [True, False],
     }
     default_options = {
         "shared": False,
@@ -41,10 +44,17 @@ class HydrogenConan(ConanFile):
         "with_grpc": True,
         "with_zeromq": True,
         "with_mqtt": True,
+        "with_ccache": False,
+        "python_gil_free": False,
     }
     
-    # Sources are located in the same place as this recipe, copy them to the recipe
-    exports_sources = "CMakeLists.txt", "src/*", "cmake/*", "include/*", "tests/*", "examples/*"
+    def export_sources(self):
+        # Sources are located in the same place as this recipe, copy them to the recipe.
+        # examples/ is not part of the CMake build, so it is not exported. tests/ is
+        # still needed because options are not known at export time and with_tests
+        # builds it.
+        for pattern in ("CMakeLists.txt", "src/*", "cmake/*", "tests/*"):
+            copy(self, pattern, src=self.recipe_folder, dst=self.export_sources_folder)
     
     def config_options(self):
         if self.settings.os == "Windows":
@@ -53,6 +63,20 @@ class HydrogenConan(ConanFile):
     def configure(self):
         if self.options.shared:
             self.options.rm_safe("fPIC")
+        if not self.options.with_python_bindings:
+            self.options.rm_safe("python_gil_free")
+    
+    def package_id(self):
+        # The compiler launcher does not change the produced binaries
+        del self.info.options.with_ccache
+    
+    def compatibility(self):
+        # Let Debug consumers fall back to an optimized binary instead of forcing a
+        # rebuild. MSVC is excluded because Debug and Release runtimes are not ABI
+        # compatible there.
+        if self.settings.build_type == "Debug" and self.settings.compiler != "msvc":
+            return [{"settings": [("build_type", build_type)]}
+                    for build_type in ("RelWithDebInfo", "Release")]
     
     def layout(self):
         cmake_layout(self)
@@ -84,13 +108,22 @@ class HydrogenConan(ConanFile):
             self.requires("mosquitto/2.0.18")
     
     def build_requirements(self):
+        # Everything declared here is a tool or test requirement, so consumers that
+        # only link against hydrogen can prune it from their graph with
+        # -c tools.graph:skip_build=True -c tools.graph:skip_test=True
         self.tool_requires("cmake/3.28.1")
         
         if self.options.with_tests:
             self.test_requires("gtest/1.14.0")
         
+        # pybind11 is only needed to compile the bindings module; keep it out of
+        # the host graph so it never propagates to consumers
         if self.options.with_python_bindings:
-            self.requires("pybind11/2.11.1")
+            # Free-threaded CPython (3.13t) support needs pybind11 >= 2.13
+            if self.options.get_safe("python_gil_free"):
+                self.tool_requires("pybind11/2.13.6")
+            else:
+                self.tool_requires("pybind11/2.11.1")
         
         if self.options.with_benchmarks:
             self.test_requires("benchmark/1.8.3")
@@ -98,6 +131,9 @@ class HydrogenConan(ConanFile):
     def generate(self):
         # Generate CMake configuration
         deps = CMakeDeps(self)
+        if self.options.with_python_bindings:
+            # pybind11 comes in as a tool requirement, expose its config to CMake
+            deps.build_context_activated = ["pybind11"]
         deps.generate()
         
         tc = CMakeToolchain(self)
@@ -111,12 +147,19 @@ class HydrogenConan(ConanFile):
         tc.variables["HYDROGEN_ENABLE_SSL"] = self.options.with_ssl
         tc.variables["HYDROGEN_ENABLE_COMPRESSION"] = self.options.with_compression
         
+        # Compiler cache: $SCCACHE_BIN (sccache) takes precedence over ccache
+        if self.options.with_ccache:
+            launcher = os.environ.get("SCCACHE_BIN") or "ccache"
+            tc.variables["CMAKE_C_COMPILER_LAUNCHER"] = launcher
+            tc.variables["CMAKE_CXX_COMPILER_LAUNCHER"] = launcher
+        
         # Set build type specific variables
         if self.settings.build_type == "Debug":
             tc.variables["HYDROGEN_ENABLE_WARNINGS"] = True
             tc.variables["HYDROGEN_ENABLE_SANITIZERS"] = True
         elif self.settings.build_type == "Release":
             tc.variables["HYDROGEN_ENABLE_LTO"] = True
+            tc.variables["HYDROGEN_BINDINGS_OPT_SIZE"] = True
         
         tc.generate()
     
@@ -0,0 +1,11 @@
+# examples/python/_bootstrap.py
+"""示例公共启动代码：把编译生成的模块目录放到 Python 搜索路径最前面"""
+import os
+import sys
+
+_ASTRO_BUILD_PATH = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), '../../build/python'))
+
+# 放在最前面，优先于已安装的旧版本；重复导入时不再追加
+if _ASTRO_BUILD_PATH not in sys.path:
+    sys.path.insert(0, _ASTRO_BUILD_PATH)
@@ -1,10 +1,71 @@
 import sys
+import math
 import time
 import threading
+from datetime import datetime, timedelta
 import numpy as np
-from PIL import Image, ImageDraw
 import pyastrodevice as astro
 
+try:
+    from numba import njit, prange
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+# 星点模板最大半径（像素），星点半径 = 1 + int(log(1 + brightness / 1000))
+STAR_STAMP_RADIUS = 6
+_stamp_dy, _stamp_dx = np.mgrid[-STAR_STAMP_RADIUS:STAR_STAMP_RADIUS + 1,
+                                -STAR_STAMP_RADIUS:STAR_STAMP_RADIUS + 1]
+# 预计算的圆盘星点模板，按半径 1..STAR_STAMP_RADIUS 索引（统一填充到最大尺寸）
+STAMP_LUT = np.stack([
+    (_stamp_dx ** 2 + _stamp_dy ** 2 <= r * r).astype(np.float32)
+    for r in range(1, STAR_STAMP_RADIUS + 1)
+])
+# 各半径档位对应的亮度下限，用于以 searchsorted 代替逐星 np.log
+STAMP_BRIGHTNESS_THRESHOLDS = 1000.0 * (np.exp(np.arange(1, STAR_STAMP_RADIUS)) - 1.0)
+
+
+def _render_light_kernel(img_out, xs, ys, bright, stamp_idx, stamps, background, noise_level):
+    """单次遍历渲染光照帧：背景 + 星点模板 + 噪声，并裁剪写入uint16缓冲区
+
+    xs/ys/bright/stamp_idx 需按 ys 升序排列，以便每行只遍历与之相交的星点。
+    """
+    height, width = img_out.shape
+    radius = stamps.shape[1] // 2
+    for y in prange(height):
+        acc = np.full(width, background, dtype=np.float32)
+        lo = np.searchsorted(ys, y - radius)
+        hi = np.searchsorted(ys, y + radius, side='right')
+        for s in range(lo, hi):
+            krow = y - ys[s] + radius
+            x0 = xs[s]
+            stamp = stamps[stamp_idx[s]]
+            for k in range(stamp.shape[1]):
+                x = x0 + k - radius
+                if 0 <= x < width:
+                    acc[x] += bright[s] * stamp[krow, k]
+        for x in range(width):
+            v = acc[x] + noise_level * np.random.standard_normal()
+            if v < 0.0:
+                v = 0.0
+            elif v > 65535.0:
+                v = 65535.0
+            img_out[y, x] = np.uint16(v)
+
+
+if HAVE_NUMBA:
+    _render_light_kernel = njit(parallel=True, fastmath=True, cache=True)(_render_light_kernel)
+
+
+ISO_TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%S.%fZ"
+
+
+def iso_timestamp_after(timestamp, seconds):
+    """在 astro.get_iso_timestamp() 格式的时间戳上加上指定秒数"""
+    t = datetime.strptime(timestamp, ISO_TIMESTAMP_FORMAT) + timedelta(seconds=seconds)
+    return t.strftime("%Y-%m-%dT%H:%M:%S.") + f"{t.microsecond // 1000:03d}Z"
+
+
 class AdvancedCamera(astro.DeviceBase):
     """高级相机设备实现，从设备基类继承"""
     
@@ -26,22 +87,30 @@ class AdvancedCamera(astro.DeviceBase):
         self.is_exposing = False
         self.image_ready = False
         self.image_data = None
+        self._image_nbytes = 0
+        
+        # 图像合成用的随机数发生器和复用的float32中间缓冲区；
+        # 输出帧每次曝光新分配，已发布的帧不会被下一次曝光覆盖
+        self._rng = np.random.default_rng()
+        self._noise_buf = np.empty((self.height, self.width), dtype=np.float32)
         
         # 初始化属性
-        self.set_property("width", self.width)
-        self.set_property("height", self.height)
-        self.set_property("pixel_size", self.pixel_size)
-        self.set_property("bit_depth", self.bit_depth)
-        self.set_property("gain", self.gain)
-        self.set_property("offset", 10)
-        self.set_property("sensor_temperature", self.sensor_temp)
-        self.set_property("cooler_temperature", self.cooler_temp)
-        self.set_property("cooler_power", self.cooler_power)
-        self.set_property("cooler_enabled", self.cooler_enabled)
-        self.set_property("exposure_time", self.exposure_time)
-        self.set_property("exposing", self.is_exposing)
-        self.set_property("image_ready", self.image_ready)
-        self.set_property("connected", False)
+        self.set_properties({
+            "width": self.width,
+            "height": self.height,
+            "pixel_size": self.pixel_size,
+            "bit_depth": self.bit_depth,
+            "gain": self.gain,
+            "offset": 10,
+            "sensor_temperature": self.sensor_temp,
+            "cooler_temperature": self.cooler_temp,
+            "cooler_power": self.cooler_power,
+            "cooler_enabled": self.cooler_enabled,
+            "exposure_time": self.exposure_time,
+            "exposing": self.is_exposing,
+            "image_ready": self.image_ready,
+            "connected": False
+        })
         
         # 设备功能
         self.capabilities = ["EXPOSURE", "COOLING", "READOUT"]
@@ -57,11 +126,18 @@ class AdvancedCamera(astro.DeviceBase):
         self.update_thread = None
         self.exposure_thread = None
         self.exposure_lock = threading.Lock()
+        self._abort_evt = threading.Event()
+        self._progress_msg = {"progress": 0.0, "elapsed": 0.0, "remaining": 0.0}
+        # 唤醒更新线程（停止或冷却器设置变化时）
+        self._update_evt = threading.Event()
+        self._last_pushed_temp = round(self.sensor_temp, 2)
+        self._last_pushed_power = self.cooler_power
     
     def start(self):
         """启动相机设备"""
         if super().start():
             self.running = True
+            self._update_evt.clear()
             self.set_property("connected", True)
             
             # 启动更新线程
@@ -76,6 +152,7 @@ class AdvancedCamera(astro.DeviceBase):
     def stop(self):
         """停止相机设备"""
         self.running = False
+        self._update_evt.set()
         
         # 等待线程结束
         if self.update_thread and self.update_thread.is_alive():
@@ -91,8 +168,12 @@ class AdvancedCamera(astro.DeviceBase):
     
     def update_loop(self):
         """温度和状态更新循环"""
+        interval = 1.0
         while self.running:
-            time.sleep(1.0)
+            self._update_evt.wait(interval)
+            self._update_evt.clear()
+            if not self.running:
+                break
             
             # 更新温度
             if self.cooler_enabled:
@@ -102,7 +183,8 @@ class AdvancedCamera(astro.DeviceBase):
                     # 根据温差调整冷却功率
                     self.cooler_power = min(100, max(0, int(abs(temp_diff) * 10)))
                     # 按冷却功率调整温度
-                    self.sensor_temp += np.sign(temp_diff) * self.cooler_power * 0.01
+                    step = self.cooler_power * 0.01
+                    self.sensor_temp += step if temp_diff > 0 else -step
                 else:
                     self.cooler_power = 10  # 维持温度所需的功率
                     self.sensor_temp = self.cooler_temp
@@ -113,9 +195,23 @@ class AdvancedCamera(astro.DeviceBase):
                 if abs(self.sensor_temp - ambient_temp) > 0.1:
                     self.sensor_temp += (ambient_temp - self.sensor_temp) * 0.05
             
-            # 发送更新的属性
-            self.set_property("sensor_temperature", round(self.sensor_temp, 2))
-            self.set_property("cooler_power", self.cooler_power)
+            # 仅在数值变化时发送更新的属性
+            changes = {}
+            sensor_temp = round(self.sensor_temp, 2)
+            if sensor_temp != self._last_pushed_temp:
+                changes["sensor_temperature"] = sensor_temp
+                self._last_pushed_temp = sensor_temp
+            if self.cooler_power != self._last_pushed_power:
+                changes["cooler_power"] = self.cooler_power
+                self._last_pushed_power = self.cooler_power
+            if changes:
+                self.set_properties(changes)
+            
+            # 冷却器关闭且温度已回到环境温度时，降低更新频率
+            if not self.cooler_enabled and abs(self.sensor_temp - 20.0) <= 0.1:
+                interval = 10.0
+            else:
+                interval = 1.0
     
     def start_exposure(self, exposure_time, is_light=True):
         """开始曝光"""
@@ -126,10 +222,13 @@ class AdvancedCamera(astro.DeviceBase):
             
             self.exposure_time = exposure_time
             self.is_exposing = True
+            self._abort_evt.clear()
             self.image_ready = False
-            self.set_property("exposing", True)
-            self.set_property("exposure_time", exposure_time)
-            self.set_property("image_ready", False)
+            self.set_properties({
+                "exposing": True,
+                "exposure_time": exposure_time,
+                "image_ready": False
+            })
             
             # 启动曝光线程
             self.exposure_thread = threading.Thread(target=self.exposure_process, args=(exposure_time, is_light))
@@ -146,6 +245,7 @@ class AdvancedCamera(astro.DeviceBase):
                 return False
             
             self.is_exposing = False
+            self._abort_evt.set()
             self.set_property("exposing", False)
             
             # 发送中止事件
@@ -168,19 +268,31 @@ class AdvancedCamera(astro.DeviceBase):
                 "exposure_time": exposure_time
             })
             
-            # 模拟曝光进度
-            while self.is_exposing and (time.time() - start_time) < exposure_time:
+            # 模拟曝光进度，进度事件间隔随曝光时长自适应（约50次/曝光）
+            interval = max(0.1, min(2.0, exposure_time / 50))
+            # 短曝光不发送进度事件，只发送开始/完成事件
+            report_progress = exposure_time >= 1.0
+            last_progress = -1.0
+            last_emit = -1.0
+            while self.is_exposing:
                 elapsed = time.time() - start_time
-                progress = elapsed / exposure_time
+                if elapsed >= exposure_time:
+                    break
                 
-                # 发送进度事件
-                self.send_event("EXPOSURE_PROGRESS", {
-                    "progress": progress,
-                    "elapsed": elapsed,
-                    "remaining": exposure_time - elapsed
-                })
+                # 发送进度事件：进度变化超过1%或距上次发送超过2秒时才发送，复用同一消息字典
+                progress = elapsed / exposure_time
+                if report_progress and (progress - last_progress > 0.01 or elapsed - last_emit > 2.0):
+                    msg = self._progress_msg
+                    msg["progress"] = progress
+                    msg["elapsed"] = elapsed
+                    msg["remaining"] = exposure_time - elapsed
+                    self.send_event("EXPOSURE_PROGRESS", msg)
+                    last_progress = progress
+                    last_emit = elapsed
                 
-                time.sleep(0.5)
+                # 中止时立即唤醒
+                if self._abort_evt.wait(min(interval, exposure_time - elapsed)):
+                    break
             
             # 检查是否被中止
             if not self.is_exposing:
@@ -196,8 +308,7 @@ class AdvancedCamera(astro.DeviceBase):
             # 设置曝光完成状态
             self.is_exposing = False
             self.image_ready = True
-            self.set_property("exposing", False)
-            self.set_property("image_ready", True)
+            self.set_properties({"exposing": False, "image_ready": True})
             
             # 发送曝光完成事件
             self.send_event("EXPOSURE_COMPLETE", {
@@ -223,41 +334,65 @@ class AdvancedCamera(astro.DeviceBase):
     
     def generate_image(self, is_light):
         """生成模拟图像"""
+        # 每帧写入新的未初始化数组（无需清零），客户端持有的旧帧视图保持有效
+        frame = np.empty((self.height, self.width), dtype=np.uint16)
         # 创建模拟图像
         if is_light:
-            # 为光照图像创建星场
-            img = Image.new('L', (self.width, self.height), 1000)  # 背景天光
-            draw = ImageDraw.Draw(img)
-            
-            # 添加随机星星
+            # 为光照图像创建星场，直接在数组中渲染，避免逐星调用PIL
             num_stars = int(200 + np.random.random() * 300)
-            for _ in range(num_stars):
-                x = int(np.random.random() * self.width)
-                y = int(np.random.random() * self.height)
-                brightness = int(np.random.pareto(2.5) * 10000)
-                size = 1 + int(np.log(1 + brightness / 1000))
-                
-                # 绘制星星
-                draw.ellipse((x-size, y-size, x+size, y+size), fill=min(65535, brightness + 1000))
-            
-            # 添加噪声
+            xs = np.random.randint(0, self.width, num_stars)
+            ys = np.random.randint(0, self.height, num_stars)
+            bright = (np.random.pareto(2.5, num_stars) * 10000).astype(np.int32)
+            stamp_idx = np.searchsorted(STAMP_BRIGHTNESS_THRESHOLDS, bright, side='right')
             noise_level = int(20 + 10 * self.gain)
-            noise = np.random.normal(0, noise_level, (self.height, self.width)).astype(np.int16)
-            img_array = np.array(img, dtype=np.int16)
-            img_array = np.clip(img_array + noise, 0, 65535).astype(np.uint16)
-            
-            # 存储图像数据
-            self.image_data = img_array.tobytes()
+
+            if HAVE_NUMBA:
+                # 融合的并行内核：一次遍历完成星点叠加、噪声和裁剪
+                order = np.argsort(ys)
+                _render_light_kernel(frame, xs[order], ys[order], bright[order],
+                                     stamp_idx[order], STAMP_LUT, 1000.0, float(noise_level))
+                img_array = frame
+            else:
+                img = np.full((self.height, self.width), 1000, dtype=np.int32)  # 背景天光
+
+                # 添加随机星星（按亮度档位查表取圆盘模板，向量化叠加）
+                stamps = STAMP_LUT[stamp_idx]
+                py = ys[:, None, None] + _stamp_dy
+                px = xs[:, None, None] + _stamp_dx
+                flux = (bright[:, None, None] * stamps).astype(np.int32)
+                inside = ((stamps > 0) & (py >= 0) & (py < self.height)
+                          & (px >= 0) & (px < self.width))
+                np.add.at(img, (py[inside], px[inside]), flux[inside])
+
+                # 添加噪声
+                self._rng.standard_normal(dtype=np.float32, out=self._noise_buf)
+                self._noise_buf *= noise_level
+                self._noise_buf += img
+                img_array = np.clip(self._noise_buf, 0, 65535, out=frame, casting='unsafe')
+
+            # 存储图像数据（本帧专用数组，不复制）
+            self.image_data = img_array
         else:
             # 黑场
             noise_level = int(5 + 5 * self.gain)
-            dark_current = int(2 * self.exposure_time * np.exp(0.1 * (self.sensor_temp + 20)))
+            dark_current = int(2 * self.exposure_time * math.exp(0.1 * (self.sensor_temp + 20)))
             
-            img_array = np.random.normal(dark_current, noise_level, (self.height, self.width))
-            img_array = np.clip(img_array, 0, 65535).astype(np.uint16)
+            # 在float32缓冲区内原地完成缩放和偏移，裁剪时直接写入uint16帧
+            self._rng.standard_normal(dtype=np.float32, out=self._noise_buf)
+            self._noise_buf *= noise_level
+            self._noise_buf += dark_current
+            img_array = np.clip(self._noise_buf, 0, 65535, out=frame, casting='unsafe')
             
-            # 存储图像数据
-            self.image_data = img_array.tobytes()
+            # 存储图像数据（本帧专用数组，不复制）
+            self.image_data = img_array
+        
+        self._image_nbytes = self.image_data.nbytes
+    
+    def get_image_bytes(self):
+        """以零拷贝的字节视图返回最近一次的图像数据"""
+        if self.image_data is None:
+            return None
+        return memoryview(self.image_data).cast('B')
     
     def set_cooler(self, enabled, temperature=None):
         """设置冷却器状态"""
@@ -268,8 +403,11 @@ class AdvancedCamera(astro.DeviceBase):
         if temperature is not None:
             self.cooler_temp = max(-30, min(50, temperature))
         
-        self.set_property("cooler_enabled", enabled)
-        self.set_property("cooler_temperature", self.cooler_temp)
+        self.set_properties({
+            "cooler_enabled": enabled,
+            "cooler_temperature": self.cooler_temp
+        })
+        self._update_evt.set()
         
         # 发送冷却器变更事件
         self.send_event("COOLER_CHANGED", {
@@ -301,11 +439,12 @@ class AdvancedCamera(astro.DeviceBase):
         is_light = params.get("light", True)
         
         if self.start_exposure(duration, is_light):
+            started_at = astro.get_iso_timestamp()
             response["status"] = "SUCCESS"
             response["details"] = {
                 "exposure_time": duration,
-                "started_at": astro.get_iso_timestamp(),
-                "estimated_completion": astro.get_iso_timestamp()  # 这里应该计算实际完成时间
+                "started_at": started_at,
+                "estimated_completion": iso_timestamp_after(started_at, duration)
             }
         else:
             response["status"] = "ERROR"
@@ -345,7 +484,7 @@ class AdvancedCamera(astro.DeviceBase):
     
     def handle_get_image(self, cmd, response):
         """处理获取图像命令"""
-        if not self.image_ready or not self.image_data:
+        if not self.image_ready or self.image_data is None:
             response["status"] = "ERROR"
             response["details"] = {"message": "No image available"}
             return
@@ -358,7 +497,7 @@ class AdvancedCamera(astro.DeviceBase):
             "width": self.width,
             "height": self.height,
             "bit_depth": self.bit_depth,
-            "size_bytes": len(self.image_data),
+            "size_bytes": self._image_nbytes,
             "download_url": f"http://server/images/{self.get_device_id()}/latest",
             "metadata": {
                 "exposure_time": self.exposure_time,
@@ -10,10 +10,17 @@ import sys
 import time
 import os
 import threading
+import asyncio
 import json
-from datetime import datetime, timedelta
+import queue
+import logging
+from logging.handlers import QueueHandler, QueueListener
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 from typing import Dict, Any, Optional
 
+import numpy as np
+
 # Add the build directory to Python path
 sys.path.append(os.path.join(os.path.dirname(__file__), '../../build'))
 
@@ -24,6 +31,90 @@ except ImportError:
     print("Run: cmake --build build --target pyhydrogen")
     sys.exit(1)
 
+# Background threads log through a queue; one listener thread does the formatting and IO
+log = logging.getLogger("hydrogen.observatory")
+
+def start_log_listener():
+    """Route the observatory logger through a QueueListener and start it"""
+    log_queue = queue.Queue(-1)
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    log.addHandler(QueueHandler(log_queue))
+    log.setLevel(logging.INFO)
+    log.propagate = False
+    listener = QueueListener(log_queue, handler)
+    listener.start()
+    return listener
+
+# Weather polling bounds (seconds); polling speeds up as conditions approach the limits
+WEATHER_POLL_MIN = float(os.environ.get("HYDROGEN_WEATHER_POLL_MIN", "5"))
+WEATHER_POLL_MAX = float(os.environ.get("HYDROGEN_WEATHER_POLL_MAX", "60"))
+
+# Upper safety limits: (snapshot key, sensor type name, max value)
+WEATHER_LIMITS = [
+    ("wind_speed", "WIND_SPEED", 15),   # Max 15 m/s
+    ("humidity", "HUMIDITY", 85),       # Max 85%
+    ("cloud_cover", "CLOUD_COVER", 30), # Max 30%
+]
+
+FITS_BLOCK = 2880
+
+def fits_card(key, value):
+    """Format one 80-column FITS header card"""
+    if isinstance(value, bool):
+        value = "%20s" % ("T" if value else "F")
+    elif isinstance(value, int):
+        value = "%20d" % value
+    elif isinstance(value, float):
+        value = "%20s" % repr(value)
+    else:
+        value = "'%-8s'" % str(value).replace("'", "''")
+    return ("%-8s= %s" % (key, value)).ljust(80)
+
+def write_fits(filename, frame, width, height, headers=()):
+    """Write a raw uint8/uint16 frame buffer as a FITS primary HDU
+    
+    headers is a sequence of (keyword, value) pairs appended after the
+    mandatory keywords, e.g. exposure time, binning and sensor temperature.
+    """
+    pixels = width * height
+    if frame.nbytes == pixels:
+        bitpix = 8
+        data = frame[:pixels]
+    elif frame.nbytes == 2 * pixels:
+        bitpix = 16
+        # FITS stores signed big-endian; BZERO maps it back to uint16
+        data = (frame.view("<u2")[:pixels] ^ 0x8000).astype(">u2")
+    else:
+        raise ValueError(f"Unsupported frame: {frame.nbytes} bytes for {width}x{height} pixels "
+                         "(only 8- and 16-bit unsigned data can be written)")
+    
+    cards = [
+        fits_card("SIMPLE", True),
+        fits_card("BITPIX", bitpix),
+        fits_card("NAXIS", 2),
+        fits_card("NAXIS1", width),
+        fits_card("NAXIS2", height),
+    ]
+    if bitpix == 16:
+        cards.append(fits_card("BZERO", 32768))
+        cards.append(fits_card("BSCALE", 1))
+    cards.extend(fits_card(key, value) for key, value in headers if value is not None)
+    cards.append("END".ljust(80))
+    header = "".join(cards)
+    header = header.ljust(-(-len(header) // FITS_BLOCK) * FITS_BLOCK)
+    
+    with open(filename, "wb") as f:
+        f.write(header.encode("ascii"))
+        data.tofile(f)
+        f.write(b"\0" * (-data.nbytes % FITS_BLOCK))
+        
+# Seconds a device liveness result is reused by show_system_status
+DEVICE_STATUS_TTL = 5.0
+
+# Optional device methods probed once at creation time
+DEVICE_CAPABILITIES = ("park", "unpark", "abort_exposure")
+
 class CompleteObservatory:
     """Complete observatory with all device types and automatic compatibility"""
     
@@ -31,7 +122,13 @@ class CompleteObservatory:
         self.devices = {}
         self.running = False
         self.observation_thread = None
-        self.weather_monitoring_thread = None
+        self.monitor_loop = None
+        self.monitor_thread = None
+        self.monitor_stop = None
+        self.weather_lock = threading.Lock()
+        self.last_weather = None  # Most recent weather snapshot, shared with the imaging loop
+        self.device_meta = {}
+        self.device_caps = {}
         
     def initialize_observatory(self):
         """Initialize the complete observatory system"""
@@ -44,10 +141,11 @@ class CompleteObservatory:
         # Initialize the compatibility system
         print("🚀 Starting automatic ASCOM/INDI compatibility system...")
         hydrogen.init_compatibility_system(
-            enable_auto_discovery=True,
+            enable_auto_discovery=False,  # Every device is created below, nothing to discover
             enable_ascom=True,
             enable_indi=True,
-            indi_base_port=7624
+            indi_base_port=7624,
+            single_issuer=True  # All devices are created here; one shared sync thread
         )
         print("✅ Compatibility system initialized")
         
@@ -71,11 +169,18 @@ class CompleteObservatory:
             ("weather", "create_compatible_observing_conditions", "Boltwood", "Cloud Sensor II", "🌤️"),
         ]
         
+        # Resolve the factory functions once, before the loop
+        creators = {device_name: getattr(hydrogen, create_func, None)
+                    for device_name, create_func, *_ in device_configs}
+        
         for device_name, create_func, manufacturer, model, icon in device_configs:
             try:
                 device_id = f"observatory_{device_name}"
-                create_function = getattr(hydrogen, create_func)
+                create_function = creators[device_name]
+                if create_function is None:
+                    raise AttributeError(f"pyhydrogen has no {create_func}")
                 self.devices[device_name] = create_function(device_id, manufacturer, model)
+                self.cache_device_meta(device_name)
                 print(f"  {icon} {device_name.title()}: {manufacturer} {model} ✅")
             except Exception as e:
                 print(f"  ❌ Failed to create {device_name}: {e}")
@@ -86,6 +191,7 @@ class CompleteObservatory:
             safety_monitor.initialize_device()
             safety_monitor.start_device()
             self.devices['safety'] = safety_monitor
+            self.cache_device_meta('safety')
             print("  🛡️ Safety Monitor: Generic SafetyMonitor ✅")
         except Exception as e:
             print(f"  ⚠️ Safety monitor not available: {e}")
@@ -96,10 +202,25 @@ class CompleteObservatory:
             cover_cal.initialize_device()
             cover_cal.start_device()
             self.devices['cover'] = cover_cal
+            self.cache_device_meta('cover')
             print("  📦 Cover Calibrator: Alnitak Flip-Flat ✅")
         except Exception as e:
             print(f"  ⚠️ Cover calibrator not available: {e}")
             
+    def cache_device_meta(self, device_name):
+        """Cache static device metadata; it does not change after initialization"""
+        device = self.devices[device_name]
+        self.device_caps[device_name] = {m for m in DEVICE_CAPABILITIES if hasattr(device, m)}
+        device_type = device.get_device_type()
+        self.device_meta[device_name] = {
+            "type": device_type,
+            "icon": self.get_device_icon(device_type),
+            "info": device.get_device_info(),
+            "online": True,
+            "checked_at": time.monotonic(),
+        }
+        return self.device_meta[device_name]
+        
     def setup_device_coordination(self):
         """Setup coordination between devices"""
         print("\n🔗 Setting up device coordination...")
@@ -127,9 +248,8 @@ class CompleteObservatory:
                 weather = self.devices['weather']
                 
                 # Set conservative safety thresholds
-                weather.set_safety_threshold(hydrogen.SensorType.WIND_SPEED, 0, 15)  # Max 15 m/s
-                weather.set_safety_threshold(hydrogen.SensorType.HUMIDITY, 0, 85)    # Max 85%
-                weather.set_safety_threshold(hydrogen.SensorType.CLOUD_COVER, 0, 30) # Max 30%
+                for _, sensor_type, limit in WEATHER_LIMITS:
+                    weather.set_safety_threshold(getattr(hydrogen.SensorType, sensor_type), 0, limit)
                 weather.enable_safety_monitoring(True)
                 
                 print("  🌤️ Weather safety thresholds configured")
@@ -138,56 +258,108 @@ class CompleteObservatory:
             print(f"  ⚠️ Error in device coordination: {e}")
             
     def start_weather_monitoring(self):
-        """Start continuous weather monitoring"""
-        def weather_monitor():
-            while self.running:
-                try:
-                    if 'weather' in self.devices:
-                        weather = self.devices['weather']
-                        weather.refresh()
-                        
-                        # Check if conditions are safe
-                        if not weather.is_safe_for_observing():
-                            print("⚠️ Weather conditions unsafe - taking protective actions")
-                            self.emergency_shutdown()
-                            
-                    time.sleep(30)  # Check every 30 seconds
-                except Exception as e:
-                    print(f"❌ Weather monitoring error: {e}")
-                    time.sleep(60)
-                    
-        self.weather_monitoring_thread = threading.Thread(target=weather_monitor, daemon=True)
-        self.weather_monitoring_thread.start()
+        """Start continuous weather monitoring on the shared monitor event loop"""
+        self.monitor_loop = asyncio.new_event_loop()
+        self.monitor_thread = threading.Thread(target=self.run_monitors, daemon=True)
+        self.monitor_thread.start()
         print("🌤️ Weather monitoring started")
         
+    def run_monitors(self):
+        """Run all monitor tasks on one event loop; returns once they finish"""
+        async def main():
+            self.monitor_stop = asyncio.Event()
+            await asyncio.gather(self.weather_monitor())
+            
+        try:
+            self.monitor_loop.run_until_complete(main())
+        finally:
+            self.monitor_loop.close()
+            
+    def stop_monitors(self):
+        """Wake all monitor tasks; safe to call from any thread"""
+        if self.monitor_stop is not None:
+            self.monitor_stop.set()
+            
+    async def weather_monitor(self):
+        loop = asyncio.get_running_loop()
+        
+        while self.running:
+            interval = WEATHER_POLL_MAX
+            try:
+                weather = self.devices.get('weather')
+                if weather is not None:
+                    # Binding calls block, so they run in the default executor
+                    await loop.run_in_executor(None, weather.refresh)
+                    snapshot = self.record_weather(await loop.run_in_executor(None, weather.get_snapshot))
+                    
+                    # Check if conditions are safe
+                    if not snapshot["safe"]:
+                        log.warning("⚠️ Weather conditions unsafe - taking protective actions")
+                        await loop.run_in_executor(None, self.emergency_shutdown)
+                        
+                    interval = self.weather_poll_interval(snapshot)
+            except Exception as e:
+                log.error("❌ Weather monitoring error: %s", e)
+                
+            # Wakes immediately when cleanup() stops the monitors
+            try:
+                await asyncio.wait_for(self.monitor_stop.wait(), timeout=interval)
+                break
+            except asyncio.TimeoutError:
+                pass
+                
+    def record_weather(self, snapshot):
+        """Timestamp a weather snapshot and publish it as the latest one"""
+        snapshot = dict(snapshot, ts=time.monotonic())
+        with self.weather_lock:
+            self.last_weather = snapshot
+        return snapshot
+        
+    def current_weather(self, weather, max_age=WEATHER_POLL_MAX):
+        """Latest weather snapshot, refreshing the sensors only if it is too old"""
+        with self.weather_lock:
+            snapshot = self.last_weather
+        if snapshot is None or time.monotonic() - snapshot["ts"] > max_age:
+            weather.refresh()
+            snapshot = self.record_weather(weather.get_snapshot())
+        return snapshot
+        
+    def weather_poll_interval(self, snapshot):
+        """Poll interval scaled by the smallest remaining margin to any safety limit"""
+        margin = min((limit - snapshot[key]) / limit for key, _, limit in WEATHER_LIMITS)
+        return max(WEATHER_POLL_MIN, min(WEATHER_POLL_MAX * margin, WEATHER_POLL_MAX))
+        
     def emergency_shutdown(self):
         """Emergency shutdown sequence"""
         print("🚨 EMERGENCY SHUTDOWN INITIATED")
         
+        devices = self.devices
+        caps = self.device_caps
+        dome = devices.get('dome')
+        telescope = devices.get('telescope')
+        cover = devices.get('cover')
+        camera = devices.get('camera')
+        
         try:
             # Close dome shutter
-            if 'dome' in self.devices:
-                self.devices['dome'].close_shutter()
+            if dome is not None:
+                dome.close_shutter()
                 print("  🏠 Dome shutter closed")
                 
             # Park telescope
-            if 'telescope' in self.devices:
-                telescope = self.devices['telescope']
-                if hasattr(telescope, 'park'):
-                    telescope.park()
-                    print("  🔭 Telescope parked")
+            if telescope is not None and 'park' in caps.get('telescope', ()):
+                telescope.park()
+                print("  🔭 Telescope parked")
                     
             # Close dust cover
-            if 'cover' in self.devices:
-                self.devices['cover'].close_cover()
+            if cover is not None:
+                cover.close_cover()
                 print("  📦 Dust cover closed")
                 
             # Stop any ongoing exposures
-            if 'camera' in self.devices:
-                camera = self.devices['camera']
-                if hasattr(camera, 'abort_exposure'):
-                    camera.abort_exposure()
-                    print("  📷 Camera exposure aborted")
+            if camera is not None and 'abort_exposure' in caps.get('camera', ()):
+                camera.abort_exposure()
+                print("  📷 Camera exposure aborted")
                     
         except Exception as e:
             print(f"❌ Error during emergency shutdown: {e}")
@@ -227,42 +399,33 @@ class CompleteObservatory:
         """Perform pre-observation safety and readiness checks"""
         print("🔍 Performing pre-observation checks...")
         
-        checks_passed = 0
-        total_checks = 0
-        
-        # Check weather conditions
+        # Build all probes up front and issue them concurrently
+        safety_probes = []
         if 'weather' in self.devices:
-            total_checks += 1
             weather = self.devices['weather']
-            weather.refresh()
-            
-            if weather.is_safe_for_observing():
-                print("  ✅ Weather conditions safe")
-                checks_passed += 1
-            else:
-                print("  ❌ Weather conditions unsafe")
-                
-        # Check safety monitor
+            safety_probes.append(("Weather conditions", lambda: weather.refresh() or weather.is_safe_for_observing()))
         if 'safety' in self.devices:
-            total_checks += 1
-            safety = self.devices['safety']
-            
-            if safety.is_safe():
-                print("  ✅ Safety monitor reports safe")
+            safety_probes.append(("Safety monitor reports", self.devices['safety'].is_safe))
+        device_probes = [(device_name, lambda device=device: device.get_device_info()) for device_name, device in self.devices.items()]
+        
+        results = self.run_concurrently(safety_probes + device_probes)
+        checks_passed = 0
+        total_checks = len(results)
+        
+        for label, ok, result in results[:len(safety_probes)]:
+            if ok and result:
+                print(f"  ✅ {label} safe")
                 checks_passed += 1
             else:
-                print("  ❌ Safety monitor reports unsafe")
+                print(f"  ❌ {label} unsafe")
                 
         # Check device connectivity
-        for device_name, device in self.devices.items():
-            total_checks += 1
-            try:
-                # Check if device is responsive
-                device_info = device.get_device_info()
+        for device_name, ok, result in results[len(safety_probes):]:
+            if ok:
                 print(f"  ✅ {device_name.title()} connected and responsive")
                 checks_passed += 1
-            except Exception as e:
-                print(f"  ❌ {device_name.title()} not responsive: {e}")
+            else:
+                print(f"  ❌ {device_name.title()} not responsive: {result}")
                 
         success_rate = (checks_passed / total_checks) * 100 if total_checks > 0 else 0
         print(f"📊 Pre-observation checks: {checks_passed}/{total_checks} passed ({success_rate:.1f}%)")
@@ -273,29 +436,28 @@ class CompleteObservatory:
         """Open the observatory for observing"""
         print("🏠 Opening observatory...")
         
+        telescope = self.devices.get('telescope')
+        dome = self.devices.get('dome')
+        cover = self.devices.get('cover')
+        
         # Unpark telescope
-        if 'telescope' in self.devices:
-            telescope = self.devices['telescope']
-            if hasattr(telescope, 'unpark'):
-                telescope.unpark()
-                print("  🔭 Telescope unparked")
+        if telescope is not None and 'unpark' in self.device_caps.get('telescope', ()):
+            telescope.unpark()
+            print("  🔭 Telescope unparked")
                 
         # Open dome shutter
-        if 'dome' in self.devices:
-            dome = self.devices['dome']
+        if dome is not None:
             dome.open_shutter()
             print("  🏠 Dome shutter opened")
             
             # Slew dome to telescope position
-            if 'telescope' in self.devices:
-                telescope = self.devices['telescope']
+            if telescope is not None:
                 tel_az = telescope.get_property("azimuth")
                 dome.slew_to_azimuth(tel_az)
                 print(f"  🏠 Dome slewed to telescope azimuth: {tel_az:.1f}°")
                 
         # Open dust cover
-        if 'cover' in self.devices:
-            cover = self.devices['cover']
+        if cover is not None:
             cover.open_cover()
             print("  📦 Dust cover opened")
             
@@ -306,14 +468,14 @@ class CompleteObservatory:
         if 'camera' in self.devices:
             camera = self.devices['camera']
             
-            # Enable cooling
-            camera.set_property("coolerOn", True)
-            camera.set_property("targetTemperature", -10.0)
+            # Enable cooling and set imaging parameters in one call
+            camera.set_properties({
+                "coolerOn": True,
+                "targetTemperature": -10.0,
+                "binning": 1,
+                "gain": 100,
+            })
             print("  ❄️ Camera cooling enabled (-10°C target)")
-            
-            # Set imaging parameters
-            camera.set_property("binning", 1)
-            camera.set_property("gain", 100)
             print("  📷 Imaging parameters set (1x1 binning, gain 100)")
             
         if 'focuser' in self.devices:
@@ -327,11 +489,10 @@ class CompleteObservatory:
         """Run the actual imaging sequence"""
         print("📸 Running imaging sequence...")
         
-        if 'camera' not in self.devices:
+        camera = self.devices.get('camera')
+        if camera is None:
             print("  ❌ No camera available for imaging")
             return
-            
-        camera = self.devices['camera']
         
         # Take a series of images
         exposures = [
@@ -340,71 +501,127 @@ class CompleteObservatory:
             ("Flat", 1, 10),      # 10x 1-second flat frames
         ]
         
+        # Session timestamp is formatted once; frames only append a counter
+        session = datetime.now().strftime("%Y%m%d_%H%M%S")
+        
+        weather = self.devices.get('weather')
+        cover = self.devices.get('cover')
+        
+        # Expand the exposure list into a per-frame plan up front:
+        # (frame type, exposure time, index, count, filename, use calibrator)
+        plan = []
         for frame_type, exposure_time, count in exposures:
-            print(f"  📸 Taking {count}x {exposure_time}s {frame_type} frames...")
+            filename_format = (frame_type + "_" + session + "_{:03d}.fits").format
+            use_calibrator = frame_type == "Flat" and cover is not None
+            plan.extend((frame_type, exposure_time, i, count, filename_format(i), use_calibrator)
+                        for i in range(1, count + 1))
+        
+        # Two preallocated frame buffers: frame N is written from one while
+        # frame N+1 is read out into the other
+        frame_buffers = [None, None]
+        slot = 0
+        
+        # Single-slot saver: frame N is written while frame N+1 integrates
+        with ThreadPoolExecutor(max_workers=1) as saver:
+            pending_save = None
             
-            for i in range(count):
+            for frame_type, exposure_time, i, count, filename, use_calibrator in plan:
+                if i == 1:
+                    print(f"  📸 Taking {count}x {exposure_time}s {frame_type} frames...")
+                    
                 try:
-                    # Check weather before each exposure
-                    if 'weather' in self.devices:
-                        weather = self.devices['weather']
-                        weather.refresh()
-                        if not weather.is_safe_for_observing():
+                    # Check weather before each exposure; reuses the monitor's snapshot while fresh
+                    if weather is not None:
+                        if not self.current_weather(weather)["safe"]:
                             print("    ⚠️ Weather turned unsafe, stopping sequence")
-                            return
+                            break
                             
                     # Take exposure
-                    if frame_type == "Flat" and 'cover' in self.devices:
+                    if use_calibrator:
                         # Turn on calibrator for flats
-                        cover = self.devices['cover']
                         cover.calibrator_on(50)  # 50% brightness
                         
+                    date_obs = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
                     camera.start_exposure(exposure_time)
-                    print(f"    📷 Exposure {i+1}/{count} started ({exposure_time}s)")
-                    
-                    # Wait for exposure to complete
-                    time.sleep(exposure_time + 2)  # Add 2 seconds for readout
+                    print(f"    📷 Exposure {i}/{count} started ({exposure_time}s)")
                     
-                    # Save image
-                    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                    filename = f"{frame_type}_{timestamp}_{i+1:03d}.fits"
-                    camera.save_image(filename)
-                    print(f"    💾 Saved: {filename}")
+                    # Wait for exposure and readout to complete
+                    self.wait_for_image(camera, exposure_time)
                     
-                    if frame_type == "Flat" and 'cover' in self.devices:
+                    if use_calibrator:
                         # Turn off calibrator
-                        cover = self.devices['cover']
                         cover.calibrator_off()
+                    
+                    # Copy the image into our own buffer before the next exposure can replace it
+                    nbytes = camera.get_image_data_size()
+                    frame = frame_buffers[slot]
+                    if frame is None or frame.nbytes != nbytes:
+                        frame = frame_buffers[slot] = np.empty(nbytes, dtype=np.uint8)
+                    camera.read_image_into(frame)
+                    width, height = camera.get_num_x(), camera.get_num_y()
+                    headers = (
+                        ("IMAGETYP", frame_type),
+                        ("DATE-OBS", date_obs),
+                        ("EXPTIME", float(exposure_time)),
+                        ("XBINNING", camera.get_bin_x()),
+                        ("YBINNING", camera.get_bin_y()),
+                        ("CCD-TEMP", camera.get_property("currentTemperature")),
+                    )
+                    
+                    # Save image in the background; at most one save in flight
+                    if pending_save is not None:
+                        pending_save.result()
+                    pending_save = saver.submit(self.save_frame, frame, width, height, headers, filename)
+                    slot ^= 1
                         
                 except Exception as e:
-                    print(f"    ❌ Error in exposure {i+1}: {e}")
+                    print(f"    ❌ Error in exposure {i}: {e}")
+            
+            if pending_save is not None:
+                pending_save.result()
                     
+    def wait_for_image(self, camera, exposure_time, poll_interval=0.05, readout_timeout=30.0):
+        """Block until the camera reports a ready image"""
+        deadline = time.monotonic() + exposure_time + readout_timeout
+        while not camera.get_image_ready():
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"Image not ready {readout_timeout}s after a {exposure_time}s exposure")
+            time.sleep(poll_interval)
+            
+    def save_frame(self, frame, width, height, headers, filename):
+        """Write a frame buffer to disk; runs on the saver thread"""
+        try:
+            write_fits(filename, frame, width, height, headers)
+            log.info("    💾 Saved: %s", filename)
+        except Exception as e:
+            log.error("    ❌ Error saving %s: %s", filename, e)
+            
     def close_observatory(self):
         """Close the observatory after observing"""
         print("🏠 Closing observatory...")
         
+        camera = self.devices.get('camera')
+        cover = self.devices.get('cover')
+        telescope = self.devices.get('telescope')
+        dome = self.devices.get('dome')
+        
         # Turn off camera cooling
-        if 'camera' in self.devices:
-            camera = self.devices['camera']
+        if camera is not None:
             camera.set_property("coolerOn", False)
             print("  ❄️ Camera cooling disabled")
             
         # Close dust cover
-        if 'cover' in self.devices:
-            cover = self.devices['cover']
+        if cover is not None:
             cover.close_cover()
             print("  📦 Dust cover closed")
             
         # Park telescope
-        if 'telescope' in self.devices:
-            telescope = self.devices['telescope']
-            if hasattr(telescope, 'park'):
-                telescope.park()
-                print("  🔭 Telescope parked")
+        if telescope is not None and 'park' in self.device_caps.get('telescope', ()):
+            telescope.park()
+            print("  🔭 Telescope parked")
                 
         # Close dome shutter
-        if 'dome' in self.devices:
-            dome = self.devices['dome']
+        if dome is not None:
             dome.close_shutter()
             print("  🏠 Dome shutter closed")
             
@@ -426,29 +643,61 @@ class CompleteObservatory:
             
         # Show device status
         print(f"\n📡 Device Status:")
+        # Only re-probe devices whose cached liveness is older than the TTL
+        now = time.monotonic()
+        probes = []
         for device_name, device in self.devices.items():
-            try:
-                device_info = device.get_device_info()
-                device_type = device.get_device_type()
-                print(f"  {self.get_device_icon(device_type)} {device_name.title()}: Online ✅")
-            except Exception as e:
-                print(f"  ❌ {device_name.title()}: Offline ({e})")
+            meta = self.device_meta.get(device_name)
+            if meta is None or "type" not in meta:
+                probes.append((device_name, lambda name=device_name: self.cache_device_meta(name)["info"]))
+            elif now - meta["checked_at"] > DEVICE_STATUS_TTL:
+                probes.append((device_name, lambda device=device: device.get_device_info()))
+                
+        for device_name, ok, result in self.run_concurrently(probes):
+            meta = self.device_meta.setdefault(device_name, {"icon": "📡"})
+            meta.update(online=ok, checked_at=now)
+            if ok:
+                meta["info"] = result
+            else:
+                meta["error"] = result
+                
+        for device_name in self.devices:
+            meta = self.device_meta[device_name]
+            if meta["online"]:
+                print(f"  {meta['icon']} {device_name.title()}: Online ✅")
+            else:
+                print(f"  ❌ {device_name.title()}: Offline ({meta['error']})")
                 
         # Show weather conditions
         if 'weather' in self.devices:
             try:
                 weather = self.devices['weather']
                 weather.refresh()
+                snapshot = weather.get_snapshot()
                 
                 print(f"\n🌤️ Weather Conditions:")
-                print(f"  🌡️ Temperature: {weather.get_temperature():.1f}°C")
-                print(f"  💧 Humidity: {weather.get_humidity():.1f}%")
-                print(f"  💨 Wind Speed: {weather.get_wind_speed():.1f} m/s")
-                print(f"  ☁️ Cloud Cover: {weather.get_cloud_cover():.1f}%")
-                print(f"  🛡️ Safe for observing: {'Yes' if weather.is_safe_for_observing() else 'No'}")
+                print(f"  🌡️ Temperature: {snapshot['temperature']:.1f}°C")
+                print(f"  💧 Humidity: {snapshot['humidity']:.1f}%")
+                print(f"  💨 Wind Speed: {snapshot['wind_speed']:.1f} m/s")
+                print(f"  ☁️ Cloud Cover: {snapshot['cloud_cover']:.1f}%")
+                print(f"  🛡️ Safe for observing: {'Yes' if snapshot['safe'] else 'No'}")
             except Exception as e:
                 print(f"❌ Error getting weather data: {e}")
                 
+    def run_concurrently(self, probes):
+        """Run (name, callable) probes in parallel, returning (name, ok, result or error) in input order"""
+        def run_probe(probe):
+            name, func = probe
+            try:
+                return name, True, func()
+            except Exception as e:
+                return name, False, e
+                
+        if not probes:
+            return []
+        with ThreadPoolExecutor(max_workers=len(probes)) as executor:
+            return list(executor.map(run_probe, probes))
+            
     def get_device_icon(self, device_type):
         """Get emoji icon for device type"""
         icons = {
@@ -468,17 +717,18 @@ class CompleteObservatory:
         
         self.running = False
         
-        # Stop monitoring threads
-        if self.weather_monitoring_thread and self.weather_monitoring_thread.is_alive():
-            self.weather_monitoring_thread.join(timeout=5)
+        # Stop the monitor event loop
+        if self.monitor_thread and self.monitor_thread.is_alive():
+            self.monitor_loop.call_soon_threadsafe(self.stop_monitors)
+            self.monitor_thread.join(timeout=5)
             
         # Stop all devices
-        for device_name, device in self.devices.items():
-            try:
-                device.stop_device()
+        probes = [(device_name, lambda device=device: device.stop_device()) for device_name, device in self.devices.items()]
+        for device_name, ok, result in self.run_concurrently(probes):
+            if ok:
                 print(f"  ✅ Stopped {device_name}")
-            except Exception as e:
-                print(f"  ⚠️ Error stopping {device_name}: {e}")
+            else:
+                print(f"  ⚠️ Error stopping {device_name}: {result}")
                 
         # Shutdown compatibility system
         try:
@@ -525,8 +775,12 @@ def main():
     print("with a full observatory setup")
     print()
     
-    observatory = CompleteObservatory()
-    observatory.run_observatory()
+    listener = start_log_listener()
+    try:
+        observatory = CompleteObservatory()
+        observatory.run_observatory()
+    finally:
+        listener.stop()
 
 if __name__ == "__main__":
     main()
@@ -22,7 +22,8 @@ class CustomFilterWheel(PyFilterWheel):
         # Override the default filter configuration
         self._movement_speed = 0.5  # positions per second (2x faster than base class)
         self._custom_thread = None
-        self._is_running = False
+        self._stop_evt = threading.Event()
+        self._last_pub_temp = None
         
     def start(self):
         """Override start method to add custom initialization"""
@@ -34,7 +35,7 @@ class CustomFilterWheel(PyFilterWheel):
         self.set_filter_offsets([0, 0, 0, 100, 120, 150, 0, 0])  # Focus offsets in steps
         
         # Start custom monitoring thread
-        self._is_running = True
+        self._stop_evt.clear()
         self._custom_thread = threading.Thread(target=self._monitor_temperature)
         self._custom_thread.daemon = True
         self._custom_thread.start()
@@ -45,11 +46,11 @@ class CustomFilterWheel(PyFilterWheel):
     def stop(self):
         """Override stop method to handle custom resources"""
         print(f"Stopping custom filter wheel: {self._device_id}")
-        self._is_running = False
+        self._stop_evt.set()
         
-        # Stop the custom thread
+        # Stop the custom thread; the event wakes it immediately
         if self._custom_thread and self._custom_thread.is_alive():
-            self._custom_thread.join(timeout=2.0)
+            self._custom_thread.join()
         
         # Stop the base device
         super().stop()
@@ -60,11 +61,19 @@ class CustomFilterWheel(PyFilterWheel):
     
     def _monitor_temperature(self):
         """Custom monitoring function that runs in a separate thread"""
-        while self._is_running:
+        t0 = time.monotonic()
+        while True:
             # Simulate temperature monitoring
-            temperature = 20.0 + (0.1 * (time.time() % 10))  # Simulate temperature fluctuations
-            self.set_property("temperature", round(temperature, 1))
-            time.sleep(2.0)
+            elapsed = time.monotonic() - t0
+            temperature = round(20.0 + (0.1 * (elapsed % 10)), 1)  # Simulate temperature fluctuations
+            
+            # Only publish when the rounded value actually changed
+            if temperature != self._last_pub_temp:
+                self.set_property("temperature", temperature)
+                self._last_pub_temp = temperature
+                
+            if self._stop_evt.wait(2.0):
+                break
 
     def simulate_movement(self, elapsed_sec):
         """Override movement simulation for faster movement speed"""
@@ -1,6 +1,14 @@
 import astrocomm
 import time
 import random
+import threading
+from collections import deque
+
+import numpy as np
+
+TELEMETRY_RING_SIZE = 4096
+TELEMETRY_BATCH_SIZE = 64
+NOISE_BUFFER_SIZE = 8192  # 必须是2的幂
 
 class MyCustomSwitch(astrocomm.device.Switch):
     def __init__(self, device_id):
@@ -8,6 +16,19 @@ class MyCustomSwitch(astrocomm.device.Switch):
         # 初始化额外属性
         self.temperature = 20.0
         self.set_property("temperature", self.temperature)
+        self._temp_h = self.get_property_handle("temperature")
+        
+        # 预生成温度噪声，用完后整体重新生成
+        self._noise = np.random.uniform(-0.5, 0.5, size=NOISE_BUFFER_SIZE).astype(np.float32)
+        self._noise_i = 0
+        
+        # 预分配温度事件，循环中复用
+        self._temp_event = astrocomm.common.EventMessage("TEMPERATURE_CHANGED")
+        self._temp_details = {"temperature": self.temperature}
+        
+        # 温度采样环形缓冲区：满时丢弃最旧样本，采样线程永不阻塞
+        self._ring = deque(maxlen=TELEMETRY_RING_SIZE)
+        self._ring_ready = threading.Event()
         
         # 添加开关
         self.add_switch("main_power", astrocomm.device.SwitchType.TOGGLE)
@@ -20,34 +41,63 @@ class MyCustomSwitch(astrocomm.device.Switch):
     def start(self):
         result = super().start()
         if result:
-            # 启动温度更新线程
-            import threading
+            # 启动温度更新线程和遥测发送线程
             self.running = True
             self.update_thread = threading.Thread(target=self.update_temp)
             self.update_thread.daemon = True
             self.update_thread.start()
+            self.sender_thread = threading.Thread(target=self.send_telemetry)
+            self.sender_thread.daemon = True
+            self.sender_thread.start()
         return result
     
     def stop(self):
         self.running = False
+        self._ring_ready.set()
         if hasattr(self, 'update_thread'):
             self.update_thread.join(timeout=1.0)
+        if hasattr(self, 'sender_thread'):
+            self.sender_thread.join(timeout=1.0)
         super().stop()
     
     def update_temp(self):
         while self.running:
             # 模拟温度变化
-            self.temperature += random.uniform(-0.5, 0.5)
-            self.set_property("temperature", self.temperature)
+            self.temperature += float(self._noise[self._noise_i])
+            self._noise_i = (self._noise_i + 1) & (NOISE_BUFFER_SIZE - 1)
+            if self._noise_i == 0:
+                self._noise[:] = np.random.uniform(-0.5, 0.5, size=NOISE_BUFFER_SIZE)
             
-            # 发送温度变更事件
-            if random.random() < 0.2:  # 20%概率发送事件
-                event = astrocomm.common.EventMessage("TEMPERATURE_CHANGED")
-                event.set_details({"temperature": self.temperature})
-                self.send_event(event)
+            # 只写入环形缓冲区，由发送线程负责属性更新和事件
+            notify = random.random() < 0.2  # 20%概率发送事件
+            self._ring.append((time.monotonic(), self.temperature, notify))
+            self._ring_ready.set()
             
             time.sleep(2)
     
+    def send_telemetry(self):
+        while self.running or self._ring:
+            self._ring_ready.wait(timeout=1.0)
+            self._ring_ready.clear()
+            
+            # 批量取出样本，每批只推送最新温度
+            while self._ring:
+                batch = []
+                try:
+                    while len(batch) < TELEMETRY_BATCH_SIZE:
+                        batch.append(self._ring.popleft())
+                except IndexError:
+                    pass
+                
+                _, temperature, _ = batch[-1]
+                self.set_property_by_handle(self._temp_h, temperature)
+                
+                # 发送温度变更事件
+                if any(notify for _, _, notify in batch):
+                    self._temp_details["temperature"] = temperature
+                    self._temp_event.set_details(self._temp_details)
+                    self.send_event(self._temp_event)
+    
     def handle_get_temp(self, cmd, response):
         response.set_status("SUCCESS")
         response.set_details({"temperature": self.temperature})
@@ -56,7 +106,7 @@ class MyCustomSwitch(astrocomm.device.Switch):
         params = cmd.get_parameters()
         if "temperature" in params:
             self.temperature = params["temperature"]
-            self.set_property("temperature", self.temperature)
+            self.set_property_by_handle(self._temp_h, self.temperature)
             response.set_status("SUCCESS")
         else:
             response.set_status("ERROR")
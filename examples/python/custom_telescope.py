@@ -1,5 +1,4 @@
 import sys
-import time
 import threading
 import numpy as np
 import pyastrodevice as astro
@@ -16,16 +15,22 @@ class CustomTelescope(astro.Telescope):
         self.register_command_handler("CUSTOM_COMMAND", self.handle_custom_command)
         self.register_command_handler("CALCULATE_FIELD", self.handle_calculate_field)
         
+        # 预先生成随机数池，供 custom_task 线程逐个取用
+        self._rng = np.random.default_rng()
+        self._pool = self._rng.random(4096)
+        self._pool_i = 0
+        
         self.is_custom_tracking = False
         self.custom_tracking_thread = None
-        self.running = False
+        # stop() 置位后 custom_task 立即退出等待
+        self._stop = threading.Event()
     
     def start(self):
         result = super().start()
         
         if result:
             astro.log_info(f"Custom telescope {self.get_device_id()} started", "CustomTelescope")
-            self.running = True
+            self._stop.clear()
             
             self.custom_tracking_thread = threading.Thread(target=self.custom_task)
             self.custom_tracking_thread.daemon = True
@@ -34,33 +39,49 @@ class CustomTelescope(astro.Telescope):
         return result
     
     def stop(self):
-        self.running = False
+        self._stop.set()
         
         if self.custom_tracking_thread and self.custom_tracking_thread.is_alive():
-            self.custom_tracking_thread.join(2.0) 
+            self.custom_tracking_thread.join(5.0)
         
         super().stop()
         astro.log_info(f"Custom telescope {self.get_device_id()} stopped", "CustomTelescope")
     
     def custom_task(self):
         counter = 0
-        while self.running:
-            time.sleep(5.0)
-            
+        while not self._stop.wait(5.0):
             counter += 1
+            # 每次迭代只取一次时间戳
+            now_iso = astro.get_iso_timestamp()
+            
+            # 一次批量更新属性，并在同一个事件中附带环境数据
+            environment = {
+                "ambient_temperature": round(15.0 + 5.0 * self._rand(), 1),
+                "humidity": round(50.0 + 20.0 * self._rand(), 1)
+            }
+            self.set_properties(environment)
             self.send_event("CUSTOM_STATUS_UPDATE", {
                 "counter": counter,
-                "timestamp": astro.get_iso_timestamp(),
-                "randomValue": np.random.random()
+                "timestamp": now_iso,
+                "randomValue": self._rand(),
+                **environment
             })
             
-            self.set_property("ambient_temperature", round(15.0 + 5.0 * np.random.random(), 1))
-            self.set_property("humidity", round(50.0 + 20.0 * np.random.random(), 1))
-            
-            astro.log_debug(f"Custom task iteration {counter}", "CustomTelescope")
+            if astro.log_enabled("debug"):
+                astro.log_debug(f"Custom task iteration {counter}", "CustomTelescope")
+    
+    def _rand(self):
+        v = float(self._pool[self._pool_i])
+        self._pool_i += 1
+        if self._pool_i >= self._pool.size:
+            self._pool = self._rng.random(4096)
+            self._pool_i = 0
+        return v
     
     def handle_custom_command(self, cmd, response):
-        astro.log_info(f"Received custom command: {cmd}", "CustomTelescope")
+        now_iso = astro.get_iso_timestamp()
+        if astro.log_enabled("info"):
+            astro.log_info(f"Received custom command: {cmd}", "CustomTelescope")
         
         if "parameters" not in cmd or not cmd["parameters"]:
             response["status"] = "ERROR"
@@ -77,20 +98,22 @@ class CustomTelescope(astro.Telescope):
             response["status"] = "SUCCESS"
             response["details"] = {
                 "message": f"Rotated {angle} degrees around {axis} axis",
-                "executionTime": astro.get_iso_timestamp()
+                "executionTime": now_iso
             }
             
             self.send_event("CUSTOM_OPERATION", {
                 "operation": "ROTATE",
                 "angle": angle,
                 "axis": axis,
-                "status": "COMPLETED"
+                "status": "COMPLETED",
+                "timestamp": now_iso
             })
         else:
             response["status"] = "ERROR"
             response["details"] = {"message": f"Unknown operation: {operation}"}
     
     def handle_calculate_field(self, cmd, response):
+        now_iso = astro.get_iso_timestamp()
         params = cmd["parameters"]
         
         fov_width = params.get("fov_width", 1.0) 
@@ -100,20 +123,23 @@ class CustomTelescope(astro.Telescope):
         dec_prop = self.get_property("dec")
         
         star_density = 100 
-        field_area = fov_width * fov_height
-        star_count = int(field_area * star_density * (1 + 0.2 * np.random.random()))
+        base = int(fov_width * fov_height * star_density)
+        # 一次取出两个随机数（Generator 自带锁，可在命令线程中调用）
+        r0, r1 = self._rng.random(2).tolist()
         
         # 构建响应
-        response["status"] = "SUCCESS"
-        response["details"] = {
+        details = {
             "field_center": {"ra": ra_prop, "dec": dec_prop},
             "field_size": {"width": fov_width, "height": fov_height},
-            "star_count": star_count,
-            "limiting_magnitude": 14.5 + 0.5 * np.random.random(),
-            "calculation_time": astro.get_iso_timestamp()
+            "star_count": base + int(0.2 * base * r0),
+            "limiting_magnitude": 14.5 + 0.5 * r1,
+            "calculation_time": now_iso
         }
+        response["status"] = "SUCCESS"
+        response["details"] = details
         
-        self.send_event("FIELD_CALCULATED", response["details"])
+        # 事件直接复用本地 dict，不再从 response 读回（避免再次转换）
+        self.send_event("FIELD_CALCULATED", details)
 
 
 def main():
@@ -1,10 +1,9 @@
 # examples/python/filter_wheel_example.py
 import sys
 import time
-import os
 
 # 将生成的模块路径添加到Python搜索路径
-sys.path.append(os.path.join(os.path.dirname(__file__), '../../build/python'))
+import _bootstrap  # noqa: F401
 
 import pyastrocomm as pac
 import pydevices
@@ -15,6 +14,8 @@ class NanoFilters(pydevices.PyFilterWheel):
         super().__init__(device_id, manufacturer, model)
         # 添加自定义滤镜
         self.filter_names = ["Red", "Green", "Blue", "Luminance", "H-Alpha", "O-III", "S-II"]
+        # 名字到位置的索引，按名字查找时无需扫描列表
+        self._name_to_pos = {name: i for i, name in enumerate(self.filter_names)}
         # 添加对应的聚焦偏移量
         self.filter_offsets = [0, 0, 0, -10, 50, 60, 55]
         
@@ -34,14 +35,13 @@ class NanoFilters(pydevices.PyFilterWheel):
     # 添加自定义方法
     def goto_filter_by_name(self, filter_name):
         """按名字切换到指定滤镜"""
-        if filter_name in self.filter_names:
-            position = self.filter_names.index(filter_name)
-            print(f"Moving to filter: {filter_name} (position {position})")
-            self.set_position(position)
-            return True
-        else:
+        position = self._name_to_pos.get(filter_name)
+        if position is None:
             print(f"Filter {filter_name} not found!")
             return False
+        print(f"Moving to filter: {filter_name} (position {position})")
+        self.set_position(position)
+        return True
 
 # 初始化日志
 pac.init_logger("python_filter_wheel.log", pac.LogLevel.DEBUG)
@@ -1,10 +1,9 @@
 # examples/python/focuser_example.py
 import sys
 import time
-import os
 
 # 将生成的模块路径添加到Python搜索路径
-sys.path.append(os.path.join(os.path.dirname(__file__), '../../build/python'))
+import _bootstrap  # noqa: F401
 
 import pyastrocomm as pac
 import pydevices
@@ -1,11 +1,11 @@
 # examples/python/guider_example.py
 import sys
 import time
-import os
 import threading
+import itertools
 
 # 将生成的模块路径添加到Python搜索路径
-sys.path.append(os.path.join(os.path.dirname(__file__), '../../build/python'))
+import _bootstrap  # noqa: F401
 
 import pyastrocomm as pac
 import pydevices
@@ -16,7 +16,12 @@ class PiGuider(pydevices.PyGuider):
         super().__init__(device_id, manufacturer, model)
         self.connected_camera = None
         self.dither_sequence = [1.5, 2.0, 2.5, 2.0, 1.5]  # 自定义抖动序列
-        self.dither_index = 0
+        self._dither_iter = itertools.cycle(self.dither_sequence)
+        
+        # 校准状态由属性监听器推送，无需轮询
+        self._calibration_state = None
+        self._calibration_done = threading.Event()
+        self.register_property_listener("calibrationState", self._on_calibration_state)
         
     def start(self):
         print("Starting PiGuider guide camera...")
@@ -34,25 +39,27 @@ class PiGuider(pydevices.PyGuider):
         
         return result
         
+    def _on_calibration_state(self, name, value):
+        """calibrationState 属性变化回调"""
+        if value in ("COMPLETED", "FAILED"):
+            self._calibration_state = value
+            self._calibration_done.set()
+        
     # 添加自定义方法
     def auto_calibrate_and_guide(self):
         """自动校准然后开始导星"""
         print("Starting automatic calibration...")
+        self._calibration_done.clear()
         self.start_calibration()
         
-        # 监控校准状态的线程
+        # 等待校准结束的线程
         def monitor_calibration():
-            while True:
-                time.sleep(1)
-                # 这里假设状态是内部枚举，实际中需要从设备获取
-                state_prop = self.get_property("calibrationState")
-                if state_prop == "COMPLETED":
-                    print("Calibration completed, starting guiding...")
-                    self.start_guiding()
-                    break
-                elif state_prop == "FAILED":
-                    print("Calibration failed!")
-                    break
+            self._calibration_done.wait()
+            if self._calibration_state == "COMPLETED":
+                print("Calibration completed, starting guiding...")
+                self.start_guiding()
+            else:
+                print("Calibration failed!")
                 
         thread = threading.Thread(target=monitor_calibration)
         thread.daemon = True
@@ -60,8 +67,7 @@ class PiGuider(pydevices.PyGuider):
     
     def auto_dither(self):
         """按照预设序列自动抖动"""
-        amount = self.dither_sequence[self.dither_index]
-        self.dither_index = (self.dither_index + 1) % len(self.dither_sequence)
+        amount = next(self._dither_iter)
         print(f"Auto dithering with amount {amount}")
         self.dither(amount, True)
 
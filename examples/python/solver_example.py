@@ -1,22 +1,25 @@
 # examples/python/solver_example.py
 import sys
 import time
-import os
+import threading
 import numpy as np
 from PIL import Image
 
 # 将生成的模块路径添加到Python搜索路径
-sys.path.append(os.path.join(os.path.dirname(__file__), '../../build/python'))
+import _bootstrap  # noqa: F401
 
 import pyastrocomm as pac
 import pydevices
 
 # 创建一个派生的解析器类
 class AIPlateSolver(pydevices.PySolver):
-    def __init__(self, device_id, manufacturer="AIPlateSolver", model="DeepSolve"):
+    def __init__(self, device_id, manufacturer="AIPlateSolver", model="DeepSolve",
+                 simulate_load=False):
         super().__init__(device_id, manufacturer, model)
         self.local_catalog_path = "/path/to/star/catalog"
         self.ai_model_loaded = False
+        # 仅用于演示：启动时模拟模型加载延迟
+        self._simulate_load = simulate_load
         
     def start(self):
         print("Starting AI Plate Solver...")
@@ -25,7 +28,8 @@ class AIPlateSolver(pydevices.PySolver):
         if result:
             # 模拟加载AI模型
             print("Loading deep learning model for plate solving...")
-            time.sleep(2)  # 模拟加载延迟
+            if self._simulate_load:
+                time.sleep(2)  # 模拟加载延迟
             self.ai_model_loaded = True
             
             # 设置解析参数
@@ -59,9 +63,13 @@ class AIPlateSolver(pydevices.PySolver):
         """加载图像文件并解析"""
         try:
             # 如果支持PIL，打开图像并转换为numpy数组
-            img = Image.open(image_path).convert('L')  # 转为灰度
-            width, height = img.size
-            img_array = np.array(img).flatten().astype(np.uint8)
+            with Image.open(image_path) as img:
+                img.draft('L', img.size)  # JPEG 可直接解码为灰度
+                if img.mode != 'L':
+                    img = img.convert('L')  # 已是灰度时不再复制
+                width, height = img.size
+                # 直接包装解码后的字节，得到一维 uint8 数组
+                img_array = np.frombuffer(img.tobytes(), dtype=np.uint8)
             
             # 设置位置提示（如果有）
             params = {}
@@ -132,19 +140,32 @@ try:
     
     # 模拟从文件解析
     print("\nSolving from file...")
-    solver.solve_from_file("/path/to/image.fits")
     
-    # 等待解析完成
-    solving = True
-    while solving:
-        time.sleep(1)
-        state = solver.get_property("state")
-        progress = solver.get_property("progress")
-        print(f"Solving state: {state}, progress: {progress}%")
-        solving = (state == "SOLVING")
+    # 等待解析完成：由属性监听器推送状态和进度
+    solve_done = threading.Event()
+    
+    def on_progress(name, value):
+        print(f"Solving progress: {value}%")
+    
+    def on_state(name, value):
+        print(f"Solving state: {value}")
+        if value != "SOLVING":
+            solve_done.set()
+    
+    solver.register_property_listener("progress", on_progress)
+    solver.register_property_listener("state", on_state)
+    solver.solve_from_file("/path/to/image.fits")
+    # 解析可能在监听器注册前已结束，此时不会再有状态变化推送
+    if solver.get_property("state") != "SOLVING":
+        solve_done.set()
     
     # 获取结果
-    solution = solver.get_solution_as_dict()
+    if not solve_done.wait(timeout=120):
+        print("\nSolving timed out")
+        solver.abort()
+        solution = None
+    else:
+        solution = solver.get_solution_as_dict()
     if solution:
         print("\nSolution found:")
         for key, value in solution.items():
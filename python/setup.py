@@ -4,82 +4,130 @@ Setup script for Hydrogen Python bindings
 
 This script provides an easy way to build and install the Hydrogen Python
 bindings with automatic ASCOM/INDI compatibility features.
+
+It configures the "python-bindings" CMake preset, which needs only CMake and
+a C++ compiler. When VCPKG_ROOT is set, dependencies are taken from vcpkg
+through its toolchain file instead.
 """
 
 import os
 import sys
+import json
+import hashlib
 import subprocess
 import shutil
+import importlib.util
+import importlib.metadata
+import base64
+import sysconfig
+import zipfile
 from pathlib import Path
 
 def run_command(cmd, cwd=None, check=True):
-    """Run a command and return the result"""
+    """Run a command, streaming its output line by line, and return the result"""
     print(f"Running: {' '.join(cmd)}")
-    result = subprocess.run(cmd, cwd=cwd, check=check, capture_output=True, text=True)
-    if result.stdout:
-        print(result.stdout)
-    if result.stderr:
-        print(result.stderr, file=sys.stderr)
-    return result
-
-def find_cmake():
-    """Find CMake executable"""
-    cmake_names = ['cmake', 'cmake3']
-    for name in cmake_names:
-        if shutil.which(name):
-            return name
-    raise RuntimeError("CMake not found. Please install CMake.")
-
-def build_hydrogen_python():
+    sys.stdout.flush()
+    with subprocess.Popen(cmd, cwd=cwd, stdout=subprocess.PIPE,
+                          stderr=subprocess.STDOUT, text=True, bufsize=1) as proc:
+        for line in proc.stdout:
+            sys.stdout.write(line)
+            sys.stdout.flush()
+        returncode = proc.wait()
+    if check and returncode != 0:
+        raise subprocess.CalledProcessError(returncode, cmd)
+    return subprocess.CompletedProcess(cmd, returncode)
+
+PYTHON_PRESET = "python-bindings"
+
+def load_build_driver(project_root):
+    """Import scripts/build-optimized.py, the shared CMake build driver"""
+    script = project_root / "scripts" / "build-optimized.py"
+    spec = importlib.util.spec_from_file_location("build_optimized", script)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def request_cmake_codemodel(build_dir):
+    """Ask CMake to write its File API codemodel on the next configure"""
+    query_dir = build_dir / ".cmake" / "api" / "v1" / "query"
+    query_dir.mkdir(parents=True, exist_ok=True)
+    (query_dir / "codemodel-v2").touch()
+
+def find_target_artifact(build_dir, target_name):
+    """Look up a target's output file in the CMake File API reply"""
+    reply_dir = build_dir / ".cmake" / "api" / "v1" / "reply"
+    try:
+        index_file = max(reply_dir.glob("index-*.json"))
+        index = json.loads(index_file.read_text())
+        codemodel_file = index["reply"]["codemodel-v2"]["jsonFile"]
+        codemodel = json.loads((reply_dir / codemodel_file).read_text())
+        
+        # Prefer the Release configuration for multi-config generators
+        configurations = sorted(codemodel["configurations"],
+                                key=lambda c: c.get("name") != "Release")
+        for configuration in configurations:
+            for target in configuration["targets"]:
+                if target["name"] != target_name:
+                    continue
+                target_info = json.loads((reply_dir / target["jsonFile"]).read_text())
+                artifact = build_dir / target_info["artifacts"][0]["path"]
+                if artifact.exists():
+                    return artifact
+    except (ValueError, KeyError, IndexError, OSError):
+        pass
+    return None
+
+def vcpkg_args():
+    """Extra configure arguments that take dependencies from vcpkg, if installed"""
+    vcpkg_root = os.environ.get("VCPKG_ROOT")
+    if not vcpkg_root:
+        return []
+    toolchain = Path(vcpkg_root) / "scripts" / "buildsystems" / "vcpkg.cmake"
+    return [f"-DCMAKE_TOOLCHAIN_FILE={toolchain}",
+            "-DVCPKG_MANIFEST_FEATURES=python-bindings"]
+
+def build_hydrogen_python(force_reconfigure=False):
     """Build Hydrogen Python bindings"""
     print("🚀 Building Hydrogen Python Bindings")
     print("=" * 50)
     
     # Get project root directory
-    project_root = Path(__file__).parent.parent
-    build_dir = project_root / "build"
+    project_root = Path(__file__).resolve().parent.parent
+    
+    # Same driver and preset as scripts/build-optimized.py, so both entry
+    # points issue identical compiler commands and share the compiler cache
+    driver = load_build_driver(project_root)
+    preset_info = driver.load_configure_preset(project_root, PYTHON_PRESET)
+    build_dir = Path(preset_info.get("binaryDir", project_root / "build" / PYTHON_PRESET))
     
     print(f"Project root: {project_root}")
     print(f"Build directory: {build_dir}")
     
-    # Create build directory
-    build_dir.mkdir(exist_ok=True)
-    
-    # Find CMake
-    cmake = find_cmake()
-    print(f"Using CMake: {cmake}")
-    
-    # Configure with Python bindings enabled
-    print("\n📋 Configuring build...")
-    configure_cmd = [
-        cmake,
-        "-DHYDROGEN_ENABLE_PYTHON_BINDINGS=ON",
-        "-DHYDROGEN_BUILD_EXAMPLES=ON",
-        "-DHYDROGEN_BUILD_TESTS=ON",
-        "-DCMAKE_BUILD_TYPE=Release",
-        str(project_root)
-    ]
+    builder = driver.HydrogenBuilder(project_root, build_dir, preset_info=preset_info)
     
-    run_command(configure_cmd, cwd=build_dir)
+    # The configure step is skipped when nothing changed since the last run
+    request_cmake_codemodel(build_dir)
+    if not builder.configure_build(PYTHON_PRESET, extra_args=vcpkg_args(),
+                                   force=force_reconfigure):
+        raise RuntimeError("CMake configuration failed")
+    if not builder.build(PYTHON_PRESET, targets=["pyhydrogen"]):
+        raise RuntimeError("Build of pyhydrogen failed")
     
-    # Build the project
-    print("\n🔨 Building project...")
-    build_cmd = [cmake, "--build", ".", "--config", "Release", "--target", "pyhydrogen"]
-    run_command(build_cmd, cwd=build_dir)
+    # Find the built module: CMake reports its location, scan only as a fallback
+    module_file = find_target_artifact(build_dir, "pyhydrogen")
     
-    # Find the built module
     module_patterns = [
         "pyhydrogen*.so",      # Linux
         "pyhydrogen*.pyd",     # Windows
         "pyhydrogen*.dylib"    # macOS
     ]
     
-    module_file = None
-    for pattern in module_patterns:
-        matches = list(build_dir.glob(f"**/{pattern}"))
-        if matches:
-            module_file = matches[0]
-            break
+    if module_file is None:
+        for pattern in module_patterns:
+            matches = list(build_dir.glob(f"**/{pattern}"))
+            if matches:
+                module_file = matches[0]
+                break
     
     if module_file:
         print(f"✅ Built Python module: {module_file}")
@@ -87,19 +135,100 @@ def build_hydrogen_python():
     else:
         raise RuntimeError("Failed to find built Python module")
 
+WHEEL_NAME = "pyhydrogen"
+WHEEL_VERSION = "1.0.0"
+
+# The star import skips underscore names, so the version metadata the
+# extension sets is re-exported explicitly
+WHEEL_INIT = """\
+\"\"\"Hydrogen Python bindings\"\"\"
+
+from .pyhydrogen import *  # noqa: F401,F403
+from .pyhydrogen import __version__, __author__, __email__  # noqa: F401
+"""
+
+WHEEL_METADATA = f"""\
+Metadata-Version: 2.1
+Name: {WHEEL_NAME}
+Version: {WHEEL_VERSION}
+Summary: Python bindings for Hydrogen
+Requires-Python: >=3.8
+"""
+
+def wheel_tag():
+    """Wheel tag for the running interpreter, e.g. cp311-cp311-linux_x86_64"""
+    python_tag = f"cp{sys.version_info.major}{sys.version_info.minor}"
+    abi_tag = python_tag + ("t" if sysconfig.get_config_var("Py_GIL_DISABLED") else "")
+    platform_tag = sysconfig.get_platform().replace("-", "_").replace(".", "_")
+    return f"{python_tag}-{abi_tag}-{platform_tag}"
+
+def build_wheel(module_file, dist_dir):
+    """Package the compiled extension as a pyhydrogen wheel in dist_dir
+    
+    The wheel is written directly with zipfile rather than through pip and
+    setuptools, so no build requirements are fetched and installing works
+    on machines without network access.
+    """
+    dist_dir.mkdir(parents=True, exist_ok=True)
+    for old_wheel in dist_dir.glob(f"{WHEEL_NAME}-*.whl"):
+        old_wheel.unlink()
+    
+    tag = wheel_tag()
+    dist_info = f"{WHEEL_NAME}-{WHEEL_VERSION}.dist-info"
+    files = {
+        f"{WHEEL_NAME}/__init__.py": WHEEL_INIT.encode(),
+        f"{WHEEL_NAME}/{module_file.name}": module_file.read_bytes(),
+        f"{dist_info}/METADATA": WHEEL_METADATA.encode(),
+        f"{dist_info}/WHEEL": (
+            "Wheel-Version: 1.0\n"
+            "Generator: hydrogen-setup\n"
+            "Root-Is-Purelib: false\n"
+            f"Tag: {tag}\n"
+        ).encode(),
+    }
+    
+    record = []
+    for name, data in files.items():
+        digest = base64.urlsafe_b64encode(hashlib.sha256(data).digest()).rstrip(b"=").decode()
+        record.append(f"{name},sha256={digest},{len(data)}")
+    record.append(f"{dist_info}/RECORD,,")
+    files[f"{dist_info}/RECORD"] = ("\n".join(record) + "\n").encode()
+    
+    wheel_file = dist_dir / f"{WHEEL_NAME}-{WHEEL_VERSION}-{tag}.whl"
+    with zipfile.ZipFile(wheel_file, "w", zipfile.ZIP_DEFLATED) as wheel:
+        for name, data in files.items():
+            wheel.writestr(name, data)
+    return wheel_file
+
 def install_module(module_file):
-    """Install the Python module"""
+    """Install the Python module as a wheel so pip tracks it"""
     print("\n📦 Installing Python module...")
     
-    # Get Python site-packages directory
-    import site
-    site_packages = site.getsitepackages()[0]
+    project_root = Path(__file__).resolve().parent.parent
+    dist_dir = project_root / "build" / "dist"
+    
+    # Skip packaging and installing when the extension is byte-identical to
+    # the one installed last time into this same interpreter and pyhydrogen
+    # is still installed there; mtimes are not trusted for this
+    hasher = hashlib.blake2b(module_file.read_bytes())
+    hasher.update(os.fsencode(sys.executable))
+    digest = hasher.hexdigest()
+    digest_file = dist_dir / "pyhydrogen.blake2b"
+    try:
+        if digest_file.read_text().strip() == digest:
+            importlib.metadata.distribution("pyhydrogen")
+            print("✅ Installed module is up to date")
+            return
+    except (OSError, importlib.metadata.PackageNotFoundError):
+        pass
+    
+    wheel_file = build_wheel(module_file, dist_dir)
     
-    # Copy module to site-packages
-    dest_file = Path(site_packages) / module_file.name
-    shutil.copy2(module_file, dest_file)
+    run_command([sys.executable, "-m", "pip", "install", str(wheel_file),
+                 "--force-reinstall", "--no-deps"])
+    digest_file.write_text(digest)
     
-    print(f"✅ Installed module to: {dest_file}")
+    print(f"✅ Installed wheel: {wheel_file.name}")
 
 def test_installation():
     """Test the installation"""
@@ -190,15 +319,18 @@ def main():
     print("Building with automatic ASCOM/INDI compatibility")
     print()
     
-    if len(sys.argv) > 1:
-        command = sys.argv[1].lower()
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    force_reconfigure = "--force-reconfigure" in sys.argv[1:]
+    
+    if args:
+        command = args[0].lower()
     else:
         command = "build"
     
     try:
         if command in ["build", "install"]:
             # Build the module
-            module_file = build_hydrogen_python()
+            module_file = build_hydrogen_python(force_reconfigure)
             
             if command == "install":
                 # Install the module
@@ -226,7 +358,7 @@ def main():
             
         elif command == "clean":
             # Clean build directory
-            project_root = Path(__file__).parent.parent
+            project_root = Path(__file__).resolve().parent.parent
             build_dir = project_root / "build"
             
             if build_dir.exists():
@@ -243,6 +375,8 @@ def main():
             print("  test     - Test existing installation")
             print("  examples - Show usage examples")
             print("  clean    - Clean build directory")
+            print("Options:")
+            print("  --force-reconfigure - Run CMake configure even if the build tree is up to date")
             sys.exit(1)
             
     except Exception as e:
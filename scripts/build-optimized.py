@@ -10,72 +10,207 @@ import subprocess
 import argparse
 import json
 import time
+import hashlib
+import functools
+import logging
 import multiprocessing
-import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+COMPILERS = ['clang++', 'g++', 'cl.exe']
+BUILD_TOOLS = ['ccache', 'sccache', 'ninja']
+
+def which_many(names: List[str]) -> Dict[str, Optional[str]]:
+    """Resolve several executables with a single pass over PATH"""
+    found: Dict[str, Optional[str]] = dict.fromkeys(names)
+    windows = sys.platform == "win32"
+    
+    # Map every accepted file name to the requested name
+    wanted: Dict[str, str] = {}
+    if windows:
+        exts = [ext.lower() for ext in os.environ.get('PATHEXT', '.EXE;.BAT;.CMD').split(os.pathsep) if ext]
+        for name in names:
+            if os.path.splitext(name)[1].lower() in exts:
+                wanted[name.lower()] = name
+            else:
+                for ext in exts:
+                    wanted.setdefault(name.lower() + ext, name)
+    else:
+        wanted = {name: name for name in names}
+    
+    remaining = set(names)
+    for directory in os.environ.get('PATH', os.defpath).split(os.pathsep):
+        if not remaining:
+            break
+        try:
+            with os.scandir(directory or os.curdir) as entries:
+                for entry in entries:
+                    name = wanted.get(entry.name.lower() if windows else entry.name)
+                    if (name in remaining and entry.is_file()
+                            and os.access(entry.path, os.X_OK)):
+                        found[name] = entry.path
+                        remaining.discard(name)
+        except OSError:
+            continue
+    return found
+
+def load_configure_preset(source_dir: Path, preset: str) -> Dict:
+    """Resolve a configure preset (generator, binaryDir, cacheVariables) from the preset files"""
+    presets: Dict[str, Dict] = {}
+    for file_name in ('CMakePresets.json', 'CMakeUserPresets.json'):
+        try:
+            with open(source_dir / file_name, 'r') as f:
+                for entry in json.load(f).get('configurePresets', []):
+                    presets[entry['name']] = entry
+        except (OSError, ValueError, KeyError):
+            continue
+    
+    def resolve(name: str) -> Dict:
+        entry = presets.get(name, {})
+        parents = entry.get('inherits', [])
+        if isinstance(parents, str):
+            parents = [parents]
+        
+        # Earlier parents take precedence, the preset itself over all of them
+        resolved: Dict = {'cacheVariables': {}}
+        for parent in reversed(parents):
+            inherited = resolve(parent)
+            resolved.update({k: v for k, v in inherited.items() if k != 'cacheVariables'})
+            resolved['cacheVariables'].update(inherited['cacheVariables'])
+        for key in ('generator', 'binaryDir'):
+            if key in entry:
+                resolved[key] = entry[key]
+        resolved['cacheVariables'].update(entry.get('cacheVariables', {}))
+        return resolved
+    
+    if preset not in presets:
+        return {}
+    
+    info = resolve(preset)
+    if 'binaryDir' in info:
+        source = source_dir.resolve()
+        for macro, value in (('${sourceDir}', str(source)),
+                             ('${sourceParentDir}', str(source.parent)),
+                             ('${sourceDirName}', source.name),
+                             ('${presetName}', preset)):
+            info['binaryDir'] = info['binaryDir'].replace(macro, value)
+    return info
+
+@functools.lru_cache(maxsize=None)
+def total_memory_gb() -> int:
+    """Total system memory in GB, probed once per process"""
+    try:
+        if sys.platform == "linux":
+            # MemTotal is always the first line of /proc/meminfo
+            with open('/proc/meminfo', 'rb') as f:
+                line = f.read(256).split(b'\n', 1)[0]
+            return int(line.split()[1]) // (1024 * 1024)
+        elif sys.platform == "darwin":
+            result = subprocess.run(['sysctl', '-n', 'hw.memsize'], 
+                                  capture_output=True, text=True)
+            if result.returncode == 0:
+                bytes_mem = int(result.stdout.strip())
+                return bytes_mem // (1024 * 1024 * 1024)
+        elif sys.platform == "win32":
+            return _windows_memory_bytes() // (1024 * 1024 * 1024)
+    except Exception:
+        pass
+    return 8  # Default fallback
+
+def _windows_memory_bytes() -> int:
+    """Physical memory via GlobalMemoryStatusEx, with psutil as fallback"""
+    try:
+        import ctypes
+        from ctypes import wintypes
+        
+        class MEMORYSTATUSEX(ctypes.Structure):
+            _fields_ = [('dwLength', wintypes.DWORD),
+                        ('dwMemoryLoad', wintypes.DWORD),
+                        ('ullTotalPhys', ctypes.c_ulonglong),
+                        ('ullAvailPhys', ctypes.c_ulonglong),
+                        ('ullTotalPageFile', ctypes.c_ulonglong),
+                        ('ullAvailPageFile', ctypes.c_ulonglong),
+                        ('ullTotalVirtual', ctypes.c_ulonglong),
+                        ('ullAvailVirtual', ctypes.c_ulonglong),
+                        ('ullAvailExtendedVirtual', ctypes.c_ulonglong)]
+        
+        status = MEMORYSTATUSEX()
+        status.dwLength = ctypes.sizeof(MEMORYSTATUSEX)
+        if ctypes.windll.kernel32.GlobalMemoryStatusEx(ctypes.byref(status)):
+            return status.ullTotalPhys
+    except Exception:
+        pass
+    import psutil
+    return psutil.virtual_memory().total
+
 class HydrogenBuilder:
     """Optimized build system for Hydrogen project"""
     
-    def __init__(self, source_dir: Path, build_dir: Path):
+    def __init__(self, source_dir: Path, build_dir: Path, generator: Optional[str] = None,
+                 preset_info: Optional[Dict] = None, quiet: bool = False):
         self.source_dir = source_dir
         self.build_dir = build_dir
+        self.generator = generator
+        self.preset_info = preset_info or {}
+        self.quiet = quiet
+        self._caps: Optional[Dict] = None
+        self._tools: Dict[str, Optional[str]] = {}
         self.start_time = time.time()
         self.build_stats = {}
         
+    def _log(self, *lines: str, level: int = logging.INFO):
+        """Write status lines with a single write; quiet mode drops anything below WARNING"""
+        if self.quiet and level < logging.WARNING:
+            return
+        sys.stdout.write('\n'.join(lines) + '\n')
+        sys.stdout.flush()
+    
     def detect_system_capabilities(self) -> Dict:
-        """Detect system capabilities for optimization"""
+        """Detect system capabilities for optimization (cached after the first call)"""
+        if self._caps is not None:
+            return self._caps
+        
+        self._tools = which_many(BUILD_TOOLS + COMPILERS)
         capabilities = {
             'cpu_cores': multiprocessing.cpu_count(),
-            'memory_gb': self._get_memory_gb(),
-            'has_ccache': shutil.which('ccache') is not None,
-            'has_sccache': shutil.which('sccache') is not None,
-            'has_ninja': shutil.which('ninja') is not None,
+            'memory_gb': total_memory_gb(),
+            'has_ccache': self._tools['ccache'] is not None,
+            'has_sccache': self._tools['sccache'] is not None,
+            'has_ninja': self._tools['ninja'] is not None,
             'compiler': self._detect_compiler(),
         }
         
-        print(f"🔍 System Capabilities:")
-        print(f"  CPU Cores: {capabilities['cpu_cores']}")
-        print(f"  Memory: {capabilities['memory_gb']} GB")
-        print(f"  Compiler: {capabilities['compiler']}")
-        print(f"  Build Tools: Ninja={capabilities['has_ninja']}, ccache={capabilities['has_ccache']}")
+        self._log(f"🔍 System Capabilities:",
+                  f"  CPU Cores: {capabilities['cpu_cores']}",
+                  f"  Memory: {capabilities['memory_gb']} GB",
+                  f"  Compiler: {capabilities['compiler']}",
+                  f"  Build Tools: Ninja={capabilities['has_ninja']}, ccache={capabilities['has_ccache']}")
         
+        self._caps = capabilities
         return capabilities
     
-    def _get_memory_gb(self) -> int:
-        """Get system memory in GB"""
-        try:
-            if sys.platform == "linux":
-                with open('/proc/meminfo', 'r') as f:
-                    for line in f:
-                        if line.startswith('MemTotal:'):
-                            kb = int(line.split()[1])
-                            return kb // (1024 * 1024)
-            elif sys.platform == "darwin":
-                result = subprocess.run(['sysctl', '-n', 'hw.memsize'], 
-                                      capture_output=True, text=True)
-                if result.returncode == 0:
-                    bytes_mem = int(result.stdout.strip())
-                    return bytes_mem // (1024 * 1024 * 1024)
-            elif sys.platform == "win32":
-                import psutil
-                return psutil.virtual_memory().total // (1024 * 1024 * 1024)
-        except:
-            pass
-        return 8  # Default fallback
+    def refresh_capabilities(self) -> Dict:
+        """Discard cached capabilities and detect them again"""
+        self._caps = None
+        return self.detect_system_capabilities()
     
     def _detect_compiler(self) -> str:
         """Detect available compiler"""
-        compilers = ['clang++', 'g++', 'cl.exe']
-        for compiler in compilers:
-            if shutil.which(compiler):
+        tools = self._tools or which_many(COMPILERS)
+        for compiler in COMPILERS:
+            if tools.get(compiler):
                 return compiler
         return 'unknown'
     
-    def configure_build(self, preset: str, extra_args: List[str] = None) -> bool:
+    def configure_build(self, preset: str, extra_args: List[str] = None, force: bool = False) -> bool:
         """Configure build with optimizations"""
-        print(f"🔧 Configuring build with preset: {preset}")
+        self._log(f"🔧 Configuring build with preset: {preset}")
         
         capabilities = self.detect_system_capabilities()
         
@@ -83,41 +218,92 @@ class HydrogenBuilder:
         cmd = ['cmake', '--preset', preset]
         
         # Add optimization flags based on system capabilities
-        optimization_flags = self._get_optimization_flags(capabilities, preset)
+        optimization_flags = self._get_optimization_flags(capabilities, preset, extra_args)
         cmd.extend(optimization_flags)
         
         # Add extra arguments
         if extra_args:
             cmd.extend(extra_args)
         
-        print(f"Configuration command: {' '.join(cmd)}")
+        self._log(f"Configuration command: {' '.join(cmd)}")
+        
+        # Skip configure when the same command and preset were already applied;
+        # the build step re-runs CMake by itself if any CMakeLists.txt changes
+        cfg_hash = self._configure_hash(cmd)
+        hash_file = self.build_dir / '.hydrogen_cfg_hash'
+        if (not force and (self.build_dir / 'CMakeCache.txt').exists()
+                and hash_file.exists() and hash_file.read_text().strip() == cfg_hash):
+            self._log("✅ Configuration up to date, skipping (use --force-reconfigure to override)")
+            return True
         
         try:
             result = subprocess.run(cmd, cwd=self.source_dir, check=True)
-            print("✅ Configuration successful")
+            try:
+                hash_file.write_text(cfg_hash)
+            except OSError:
+                pass
+            self._log("✅ Configuration successful")
             return True
         except subprocess.CalledProcessError as e:
-            print(f"❌ Configuration failed: {e}")
+            self._log(f"❌ Configuration failed: {e}", level=logging.ERROR)
             return False
     
-    def _get_optimization_flags(self, capabilities: Dict, preset: str) -> List[str]:
+    def _configure_hash(self, cmd: List[str]) -> str:
+        """Hash of the configure command and the preset files it depends on"""
+        digest = hashlib.sha256('\0'.join(cmd).encode())
+        for file_name in ('CMakePresets.json', 'CMakeUserPresets.json'):
+            preset_file = self.source_dir / file_name
+            if preset_file.exists():
+                digest.update(preset_file.read_bytes())
+        return digest.hexdigest()
+    
+    def _get_optimization_flags(self, capabilities: Dict, preset: str,
+                                extra_args: List[str] = None) -> List[str]:
         """Get optimization flags based on system capabilities"""
         flags = []
         
+        # Select generator: explicit choice, else Ninja when available,
+        # else whatever the preset specifies
+        if not any(arg.startswith('-G') for arg in extra_args or []):
+            generator = self.generator
+            if not generator and capabilities['has_ninja']:
+                generator = 'Ninja'
+            if generator and generator != self.preset_info.get('generator'):
+                flags.extend(['-G', generator])
+            if generator == 'Ninja' and self._tools.get('ninja'):
+                flags.append(f"-DCMAKE_MAKE_PROGRAM={self._tools['ninja']}")
+        
         # Enable build optimizations
         flags.append('-DHYDROGEN_ENABLE_BUILD_OPTIMIZATIONS=ON')
         
+        # Fetch third-party sources shallowly and do not re-check them
+        # against the remote on every configure
+        flags.append('-DHYDROGEN_FETCH_SHALLOW=ON')
+        flags.append('-DFETCHCONTENT_UPDATES_DISCONNECTED=ON')
+        
+        # Track header dependencies from compiler depfiles rather than
+        # CMake's own scanner (Makefile generators; Ninja always does)
+        flags.append('-DCMAKE_DEPENDS_USE_COMPILER=TRUE')
+        
         # Configure parallel builds
-        parallel_jobs = max(1, capabilities['cpu_cores'] * 3 // 4)
+        parallel_jobs = self._parallel_jobs(capabilities)
         flags.append(f'-DCMAKE_BUILD_PARALLEL_LEVEL={parallel_jobs}')
         
-        # Enable compiler caching
+        # Enable compiler caching through the launcher variables directly
+        launcher = self._compiler_launcher(capabilities)
+        if launcher:
+            flags.append(f'-DCMAKE_C_COMPILER_LAUNCHER={launcher}')
+            flags.append(f'-DCMAKE_CXX_COMPILER_LAUNCHER={launcher}')
         if capabilities['has_ccache']:
             flags.append('-DHYDROGEN_ENABLE_CCACHE=ON')
         
-        # Enable unity builds for large systems
-        if capabilities['memory_gb'] >= 16 and capabilities['cpu_cores'] >= 8:
+        # Enable unity builds unless the machine is very small; batches grow
+        # with the core count. Targets already use precompiled headers
+        if capabilities['memory_gb'] >= 4 and capabilities['cpu_cores'] >= 4:
+            batch_size = min(16, max(4, capabilities['cpu_cores']))
             flags.append('-DHYDROGEN_ENABLE_UNITY_BUILD=ON')
+            flags.append(f'-DHYDROGEN_UNITY_BUILD_BATCH_SIZE={batch_size}')
+            flags.append('-DCMAKE_PCH_INSTANTIATE_TEMPLATES=ON')
         
         # Enable LTO for release builds
         if 'release' in preset.lower():
@@ -129,18 +315,58 @@ class HydrogenBuilder:
         
         return flags
     
+    def _parallel_jobs(self, capabilities: Dict, cores_share: float = 0.75,
+                       memory_per_job_gb: int = 2) -> int:
+        """Number of parallel jobs, bounded by cores and by available memory"""
+        jobs = max(1, int(capabilities['cpu_cores'] * cores_share))
+        if capabilities['memory_gb'] / jobs < memory_per_job_gb:
+            jobs = max(1, capabilities['memory_gb'] // memory_per_job_gb)
+        return jobs
+    
+    def _build_generator(self) -> Optional[str]:
+        """Generator of the configured build tree, from its CMakeCache.txt"""
+        try:
+            with open(self.build_dir / 'CMakeCache.txt', 'r') as f:
+                for line in f:
+                    if line.startswith('CMAKE_GENERATOR:'):
+                        return line.split('=', 1)[1].strip()
+        except OSError:
+            pass
+        return self.generator or self.preset_info.get('generator')
+    
+    def _compiler_launcher(self, capabilities: Dict) -> Optional[str]:
+        """Pick the compiler cache to use as launcher (ccache preferred)"""
+        if capabilities['has_ccache']:
+            return 'ccache'
+        if capabilities['has_sccache']:
+            return 'sccache'
+        return None
+    
+    def _compiler_cache_stats(self, launcher: Optional[str], env: Dict[str, str]) -> Optional[str]:
+        """Return the compiler cache statistics as printed by the tool"""
+        if not launcher:
+            return None
+        stats_cmd = [launcher, '-s'] if launcher == 'ccache' else [launcher, '--show-stats']
+        try:
+            result = subprocess.run(stats_cmd, capture_output=True, text=True, env=env)
+            return result.stdout if result.returncode == 0 else None
+        except OSError:
+            return None
+    
     def build(self, preset: str, targets: List[str] = None, verbose: bool = False) -> bool:
         """Execute optimized build"""
-        print(f"🔨 Building with preset: {preset}")
+        self._log(f"🔨 Building with preset: {preset}")
         
         capabilities = self.detect_system_capabilities()
         
         # Base build command
         cmd = ['cmake', '--build', '--preset', preset]
         
-        # Add parallel build configuration
-        parallel_jobs = max(1, capabilities['cpu_cores'] * 3 // 4)
-        cmd.extend(['--parallel', str(parallel_jobs)])
+        # Parallelism goes through CMAKE_BUILD_PARALLEL_LEVEL; Ninja schedules
+        # itself, other generators also get an explicit --parallel
+        parallel_jobs = self._parallel_jobs(capabilities)
+        if self._build_generator() != 'Ninja':
+            cmd.extend(['--parallel', str(parallel_jobs)])
         
         # Add targets if specified
         if targets:
@@ -151,73 +377,88 @@ class HydrogenBuilder:
         if verbose:
             cmd.append('--verbose')
         
-        print(f"Build command: {' '.join(cmd)}")
+        self._log(f"Build command: {' '.join(cmd)}")
+        
+        # Compare cache hits by content and keep one cache directory per user
+        launcher = self._compiler_launcher(capabilities)
+        env = os.environ.copy()
+        env['CMAKE_BUILD_PARALLEL_LEVEL'] = str(parallel_jobs)
+        if launcher == 'ccache':
+            env.setdefault('CCACHE_COMPILERCHECK', 'content')
+            env.setdefault('CCACHE_FILECLONE', '1')
+            env.setdefault('CCACHE_DIR', str(Path.home() / '.cache' / 'hydrogen-ccache'))
+        cache_stats_before = self._compiler_cache_stats(launcher, env)
         
         build_start = time.time()
         
         try:
-            result = subprocess.run(cmd, cwd=self.source_dir, check=True)
+            result = subprocess.run(cmd, cwd=self.source_dir, check=True, env=env)
             build_duration = time.time() - build_start
             
             self.build_stats['build_duration'] = build_duration
             self.build_stats['parallel_jobs'] = parallel_jobs
+            if launcher:
+                self.build_stats['compiler_cache'] = {
+                    'launcher': launcher,
+                    'stats_before': cache_stats_before,
+                    'stats_after': self._compiler_cache_stats(launcher, env),
+                }
             
-            print(f"✅ Build successful in {build_duration:.1f}s using {parallel_jobs} parallel jobs")
+            self._log(f"✅ Build successful in {build_duration:.1f}s using {parallel_jobs} parallel jobs")
             return True
         except subprocess.CalledProcessError as e:
-            print(f"❌ Build failed: {e}")
+            self._log(f"❌ Build failed: {e}", level=logging.ERROR)
             return False
     
     def test(self, preset: str, test_types: List[str] = None, parallel: bool = True) -> bool:
         """Run optimized tests"""
-        print(f"🧪 Running tests with preset: {preset}")
+        self._log(f"🧪 Running tests with preset: {preset}")
         
         capabilities = self.detect_system_capabilities()
         
-        # Base test command
-        cmd = ['ctest', '--preset', preset]
-        
         # Configure parallel testing
+        test_jobs = 1
         if parallel:
-            test_jobs = max(1, capabilities['cpu_cores'] // 2)
-            cmd.extend(['--parallel', str(test_jobs)])
+            test_jobs = self._parallel_jobs(capabilities, cores_share=1.0, memory_per_job_gb=1)
         
-        # Add test type filters
+        # A single ctest run selects every requested label (repeated
+        # --label-regex would AND them), so no test runs twice and only one
+        # run writes Testing/Temporary in the build tree
+        cmd = ['ctest', '--preset', preset]
+        if parallel:
+            cmd.extend(['--parallel', str(test_jobs)])
         if test_types:
-            for test_type in test_types:
-                cmd.extend(['--label-regex', test_type])
-        
-        # Add output options
-        cmd.extend(['--output-on-failure', '--timeout', '300'])
+            cmd.extend(['--label-regex', '|'.join(test_types)])
+        junit_file = self.build_dir / f"test-{'-'.join(test_types) if test_types else 'all'}.xml"
+        cmd.extend(['--output-on-failure', '--timeout', '300',
+                    '--output-junit', str(junit_file)])
         
-        print(f"Test command: {' '.join(cmd)}")
+        self._log(f"Test command: {' '.join(cmd)}")
         
         test_start = time.time()
+        success = subprocess.run(cmd, cwd=self.source_dir).returncode == 0
         
-        try:
-            result = subprocess.run(cmd, cwd=self.source_dir, check=True)
-            test_duration = time.time() - test_start
-            
-            self.build_stats['test_duration'] = test_duration
-            
-            print(f"✅ Tests passed in {test_duration:.1f}s")
-            return True
-        except subprocess.CalledProcessError as e:
-            print(f"❌ Tests failed: {e}")
-            return False
+        test_duration = time.time() - test_start
+        self.build_stats['test_duration'] = test_duration
+        
+        if success:
+            self._log(f"✅ Tests passed in {test_duration:.1f}s")
+        else:
+            self._log("❌ Tests failed", level=logging.ERROR)
+        return success
     
     def package(self, preset: str) -> bool:
         """Create optimized package"""
-        print(f"📦 Creating package with preset: {preset}")
+        self._log(f"📦 Creating package with preset: {preset}")
         
         cmd = ['cmake', '--build', '--preset', preset, '--target', 'package']
         
         try:
             result = subprocess.run(cmd, cwd=self.source_dir, check=True)
-            print("✅ Package created successfully")
+            self._log("✅ Package created successfully")
             return True
         except subprocess.CalledProcessError as e:
-            print(f"❌ Package creation failed: {e}")
+            self._log(f"❌ Package creation failed: {e}", level=logging.ERROR)
             return False
     
     def generate_performance_report(self) -> Dict:
@@ -231,47 +472,87 @@ class HydrogenBuilder:
             'system_info': self.detect_system_capabilities(),
         }
         
-        # Save report to file
+        # Save report to file; written to a temporary file and renamed so
+        # readers never see a partial report
         report_file = self.build_dir / 'performance_report.json'
-        with open(report_file, 'w') as f:
-            json.dump(report, f, indent=2)
-        
-        print(f"📊 Performance report saved to: {report_file}")
+        tmp_file = report_file.with_suffix('.json.tmp')
+        if orjson is not None:
+            tmp_file.write_bytes(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+        else:
+            with open(tmp_file, 'w') as f:
+                json.dump(report, f, indent=2)
+        os.replace(tmp_file, report_file)
+        
+        self._log(f"📊 Performance report saved to: {report_file}")
         return report
     
-    def cleanup_build_artifacts(self, keep_essentials: bool = True):
-        """Clean up build artifacts to save space"""
-        print("🧹 Cleaning up build artifacts...")
-        
-        cleanup_patterns = [
-            '**/*.tmp',
-            '**/*.log',
-            '**/CMakeFiles/**/*.o',
-            '**/CMakeFiles/**/*.obj',
-            '**/.ninja_*',
-        ]
-        
-        if not keep_essentials:
-            cleanup_patterns.extend([
-                '**/CMakeFiles',
-                '**/Testing',
-                '**/_deps',
-            ])
+    def cleanup_build_artifacts(self, keep_essentials: bool = True, clean_deps: bool = False):
+        """Clean up build artifacts to save space
+        
+        Fetched dependencies under _deps are kept unless clean_deps is set,
+        since re-downloading them costs more than the disk space they take.
+        """
+        self._log("🧹 Cleaning up build artifacts...")
+        
+        # Single walk over the build tree; names are matched as plain strings
+        # and paths are only built for entries that get removed
+        file_suffixes = ('.tmp', '.log')
+        object_suffixes = ('.o', '.obj')
+        artifact_dirs = set() if keep_essentials else {'CMakeFiles', 'Testing'}
+        if clean_deps:
+            artifact_dirs.add('_deps')
+        
+        # Collect victims in one walk, then delete them from a small pool;
+        # unlinks in different directories do not contend with each other
+        victims: List[Tuple[str, bool]] = []
+        root_dir = str(self.build_dir)
+        for root, dirs, files in os.walk(root_dir):
+            in_cmakefiles = 'CMakeFiles' in os.path.relpath(root, root_dir).split(os.sep)
+            
+            # Remove matching directories and do not descend into them
+            kept = []
+            for name in dirs:
+                if name in artifact_dirs or name.startswith('.ninja_'):
+                    victims.append((os.path.join(root, name), True))
+                else:
+                    kept.append(name)
+            dirs[:] = kept
+            
+            for name in files:
+                if (name.endswith(file_suffixes) or name.startswith('.ninja_')
+                        or (in_cmakefiles and name.endswith(object_suffixes))):
+                    victims.append((os.path.join(root, name), False))
+        
+        def remove(path: str, is_dir: bool) -> bool:
+            try:
+                if is_dir:
+                    # Leaves first, without rmtree's per-entry overhead
+                    for root, dirs, files in os.walk(path, topdown=False):
+                        for name in files:
+                            os.unlink(os.path.join(root, name))
+                        for name in dirs:
+                            dir_path = os.path.join(root, name)
+                            if os.path.islink(dir_path):
+                                os.unlink(dir_path)
+                            else:
+                                os.rmdir(dir_path)
+                    os.rmdir(path)
+                else:
+                    os.unlink(path)
+                return True
+            except FileNotFoundError:
+                return False
+            except OSError as e:
+                self._log(f"Warning: Could not clean {path}: {e}", level=logging.WARNING)
+                return False
         
         cleaned_count = 0
-        for pattern in cleanup_patterns:
-            for file_path in self.build_dir.glob(pattern):
-                try:
-                    if file_path.is_file():
-                        file_path.unlink()
-                        cleaned_count += 1
-                    elif file_path.is_dir():
-                        shutil.rmtree(file_path)
-                        cleaned_count += 1
-                except Exception as e:
-                    print(f"Warning: Could not clean {file_path}: {e}")
-        
-        print(f"✅ Cleaned {cleaned_count} build artifacts")
+        if victims:
+            workers = min(8, os.cpu_count() or 1)
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                cleaned_count = sum(pool.map(lambda victim: remove(*victim), victims))
+        
+        self._log(f"✅ Cleaned {cleaned_count} build artifacts")
 
 def main():
     parser = argparse.ArgumentParser(description='Hydrogen Optimized Build Script')
@@ -283,36 +564,46 @@ def main():
     parser.add_argument('--package', action='store_true', help='Create package after building')
     parser.add_argument('--targets', nargs='+', help='Specific targets to build')
     parser.add_argument('--verbose', action='store_true', help='Verbose output')
+    parser.add_argument('--quiet', action='store_true', help='Only print warnings, errors and the final status')
     parser.add_argument('--cleanup', action='store_true', help='Clean up build artifacts after completion')
+    parser.add_argument('--cleanup-deps', action='store_true', help='Also remove fetched dependencies (_deps) during cleanup')
     parser.add_argument('--source-dir', type=Path, default=Path.cwd(), help='Source directory')
     parser.add_argument('--build-dir', type=Path, help='Build directory (auto-detected if not specified)')
+    parser.add_argument('--generator', help='CMake generator (defaults to Ninja when available)')
+    parser.add_argument('--force-reconfigure', action='store_true', help='Run CMake configure even if nothing changed')
     
     args = parser.parse_args()
     
+    # Resolve the preset once; its binaryDir is where CMake will build
+    preset_info = load_configure_preset(args.source_dir, args.preset)
+    
     # Determine build directory
     if args.build_dir:
         build_dir = args.build_dir
+    elif 'binaryDir' in preset_info:
+        build_dir = Path(preset_info['binaryDir'])
     else:
         build_dir = args.source_dir / 'build' / args.preset
     
-    print(f"🚀 Hydrogen Optimized Build System")
-    print(f"Source: {args.source_dir}")
-    print(f"Build: {build_dir}")
-    print(f"Preset: {args.preset}")
-    print()
+    builder = HydrogenBuilder(args.source_dir, build_dir, args.generator, preset_info,
+                              quiet=args.quiet)
     
-    builder = HydrogenBuilder(args.source_dir, build_dir)
+    builder._log(f"🚀 Hydrogen Optimized Build System",
+                 f"Source: {args.source_dir}",
+                 f"Build: {build_dir}",
+                 f"Preset: {args.preset}",
+                 "")
     
     success = True
     
     # Configuration phase
     if not args.build_only:
-        success = builder.configure_build(args.preset)
+        success = builder.configure_build(args.preset, force=args.force_reconfigure)
         if not success:
             sys.exit(1)
     
     if args.configure_only:
-        print("✅ Configuration completed")
+        builder._log("✅ Configuration completed")
         sys.exit(0)
     
     # Build phase
@@ -331,8 +622,8 @@ def main():
     report = builder.generate_performance_report()
     
     # Cleanup if requested
-    if args.cleanup:
-        builder.cleanup_build_artifacts()
+    if args.cleanup or args.cleanup_deps:
+        builder.cleanup_build_artifacts(clean_deps=args.cleanup_deps)
     
     # Final status
     if success:
@@ -123,6 +123,12 @@ public:
 using CommandHandler =
     std::function<void(const CommandMessage &, ResponseMessage &)>;
 
+/**
+ * @brief Property change listener function type
+ */
+using PropertyListener =
+    std::function<void(const std::string &property, const json &value)>;
+
 /**
  * @class DeviceBase
  * @brief Base implementation for astronomical devices
@@ -155,6 +161,55 @@ public:
   std::vector<std::string> getCapabilities() const override;
   bool hasCapability(const std::string &capability) const override;
 
+  /**
+   * @brief Set multiple device properties at once
+   *
+   * All properties are updated under a single lock and a single
+   * properties changed event is emitted for the whole batch.
+   *
+   * @param properties JSON object mapping property names to values
+   */
+  void setProperties(const json &properties);
+
+  /**
+   * @brief Get several device properties at once
+   *
+   * All values are read under a single lock, so they form a consistent
+   * snapshot. Unknown properties map to null.
+   *
+   * @param properties Property names
+   * @return JSON object mapping property names to values
+   */
+  json getProperties(const std::vector<std::string> &properties) const;
+
+  /**
+   * @brief Opaque handle to a property slot
+   */
+  using PropertyHandle = std::size_t;
+
+  /**
+   * @brief Resolve a property name to a handle once
+   *
+   * Does not create the property; it appears in getAllProperties() only
+   * once a value has been set. Resolving the same name again returns the
+   * same handle.
+   *
+   * @param property Property name
+   * @return Handle for setPropertyByHandle()
+   */
+  PropertyHandle getPropertyHandle(const std::string &property);
+
+  /**
+   * @brief Set a property through a handle from getPropertyHandle()
+   *
+   * Skips the name lookup of setProperty().
+   *
+   * @param handle Property handle
+   * @param value Property value as JSON
+   * @throws std::out_of_range if the handle is unknown
+   */
+  void setPropertyByHandle(PropertyHandle handle, const json &value);
+
   /**
    * @brief Register a command handler
    * @param command Command name
@@ -163,6 +218,14 @@ public:
   void registerCommandHandler(const std::string &command,
                               CommandHandler handler);
 
+  /**
+   * @brief Register a listener called whenever a property is set
+   * @param property Property name
+   * @param listener Listener function, called after the value is stored
+   */
+  void registerPropertyListener(const std::string &property,
+                                PropertyListener listener);
+
   /**
    * @brief Add a capability to the device
    * @param capability Capability name
@@ -204,6 +267,20 @@ protected:
                                         const json &value,
                                         const json &previousValue);
 
+  /**
+   * @brief Send a single event for a batch of property changes
+   * @param changes JSON object mapping property names to
+   *        {"value", "previousValue"} objects
+   */
+  virtual void sendPropertiesChangedEvent(const json &changes);
+
+  /**
+   * @brief Call the listeners registered for a property
+   * @param property Property name
+   * @param value New value
+   */
+  void notifyPropertyListeners(const std::string &property, const json &value);
+
   /**
    * @brief Initialize default properties
    */
@@ -219,10 +296,28 @@ protected:
   // Property management
   mutable std::mutex propertiesMutex_;
   std::unordered_map<std::string, json> properties_;
+  // Map nodes are stable, so handles can point straight at them; a slot
+  // stays null until the property is first set through its handle
+  struct PropertyHandleEntry {
+    std::string name;
+    std::pair<const std::string, json> *slot;
+  };
+  std::vector<PropertyHandleEntry> propertyHandles_;
+  std::unordered_map<std::string, PropertyHandle> propertyHandleIndex_;
   std::vector<std::string> capabilities_;
 
-  // Command handling
-  std::unordered_map<std::string, CommandHandler> commandHandlers_;
+  // Command handling; handlers are looked up under the mutex and run
+  // outside it, so they may register further handlers
+  std::mutex commandHandlersMutex_;
+  std::unordered_map<std::string, std::shared_ptr<const CommandHandler>>
+      commandHandlers_;
+
+  // Property listeners, held by shared_ptr so notification can snapshot
+  // them without copying the callables themselves
+  std::mutex listenersMutex_;
+  std::unordered_map<std::string,
+                     std::vector<std::shared_ptr<const PropertyListener>>>
+      propertyListeners_;
 
   // State management
   bool running_;
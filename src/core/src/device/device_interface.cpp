@@ -57,6 +57,67 @@ void DeviceBase::setProperty(const std::string &property, const json &value) {
 
   // Send property changed event
   sendPropertyChangedEvent(property, value, previousValue);
+  notifyPropertyListeners(property, value);
+}
+
+void DeviceBase::setProperties(const json &properties) {
+  if (!properties.is_object() || properties.empty()) {
+    return;
+  }
+
+  json changes = json::object();
+
+  {
+    std::lock_guard<std::mutex> lock(propertiesMutex_);
+    for (const auto &[key, value] : properties.items()) {
+      json previousValue;
+      auto it = properties_.find(key);
+      if (it != properties_.end()) {
+        previousValue = it->second;
+      }
+      properties_[key] = value;
+      changes[key] = {{"value", value}, {"previousValue", previousValue}};
+    }
+  }
+
+  // Send one event for the whole batch
+  sendPropertiesChangedEvent(changes);
+  for (const auto &[key, value] : properties.items()) {
+    notifyPropertyListeners(key, value);
+  }
+}
+
+DeviceBase::PropertyHandle
+DeviceBase::getPropertyHandle(const std::string &property) {
+  std::lock_guard<std::mutex> lock(propertiesMutex_);
+  auto [indexIt, inserted] =
+      propertyHandleIndex_.try_emplace(property, propertyHandles_.size());
+  if (inserted) {
+    auto it = properties_.find(property);
+    propertyHandles_.push_back(
+        {property, it != properties_.end() ? &*it : nullptr});
+  }
+  return indexIt->second;
+}
+
+void DeviceBase::setPropertyByHandle(PropertyHandle handle, const json &value) {
+  std::pair<const std::string, json> *slot;
+  json previousValue;
+
+  {
+    std::lock_guard<std::mutex> lock(propertiesMutex_);
+    auto &entry = propertyHandles_.at(handle);
+    if (!entry.slot) {
+      entry.slot = &*properties_.try_emplace(entry.name).first;
+    }
+    slot = entry.slot;
+    previousValue = std::move(slot->second);
+    slot->second = value;
+  }
+
+  // Send property changed event
+  sendPropertyChangedEvent(slot->first, value, previousValue);
+  notifyPropertyListeners(slot->first, value);
 }
 
 json DeviceBase::getProperty(const std::string &property) const {
@@ -68,6 +129,17 @@ json DeviceBase::getProperty(const std::string &property) const {
   return json();
 }
 
+json DeviceBase::getProperties(
+    const std::vector<std::string> &properties) const {
+  std::lock_guard<std::mutex> lock(propertiesMutex_);
+  json result = json::object();
+  for (const auto &property : properties) {
+    auto it = properties_.find(property);
+    result[property] = it != properties_.end() ? it->second : json();
+  }
+  return result;
+}
+
 json DeviceBase::getAllProperties() const {
   std::lock_guard<std::mutex> lock(propertiesMutex_);
   return json(properties_);
@@ -86,7 +158,34 @@ bool DeviceBase::hasCapability(const std::string &capability) const {
 
 void DeviceBase::registerCommandHandler(const std::string &command,
                                         CommandHandler handler) {
-  commandHandlers_[command] = handler;
+  std::lock_guard<std::mutex> lock(commandHandlersMutex_);
+  commandHandlers_[command] =
+      std::make_shared<const CommandHandler>(std::move(handler));
+}
+
+void DeviceBase::registerPropertyListener(const std::string &property,
+                                          PropertyListener listener) {
+  std::lock_guard<std::mutex> lock(listenersMutex_);
+  propertyListeners_[property].push_back(
+      std::make_shared<const PropertyListener>(std::move(listener)));
+}
+
+void DeviceBase::notifyPropertyListeners(const std::string &property,
+                                         const json &value) {
+  std::vector<std::shared_ptr<const PropertyListener>> listeners;
+  {
+    std::lock_guard<std::mutex> lock(listenersMutex_);
+    auto it = propertyListeners_.find(property);
+    if (it == propertyListeners_.end()) {
+      return;
+    }
+    listeners = it->second;
+  }
+
+  // Called without the lock so listeners may set properties themselves
+  for (const auto &listener : listeners) {
+    (*listener)(property, value);
+  }
 }
 
 void DeviceBase::addCapability(const std::string &capability) {
@@ -107,15 +206,23 @@ void DeviceBase::removeCapability(const std::string &capability) {
 void DeviceBase::handleCommandMessage(const CommandMessage &cmd) {
   std::string command = cmd.getCommand();
 
-  auto it = commandHandlers_.find(command);
-  if (it != commandHandlers_.end()) {
+  std::shared_ptr<const CommandHandler> handler;
+  {
+    std::lock_guard<std::mutex> lock(commandHandlersMutex_);
+    auto it = commandHandlers_.find(command);
+    if (it != commandHandlers_.end()) {
+      handler = it->second;
+    }
+  }
+
+  if (handler) {
     ResponseMessage response;
     response.setOriginalMessageId(cmd.getMessageId());
     response.setDeviceId(deviceId_);
     response.setCommand(command);
 
     try {
-      it->second(cmd, response);
+      (*handler)(cmd, response);
       if (response.getStatus().empty()) {
         response.setStatus("OK");
       }
@@ -164,6 +271,14 @@ void DeviceBase::sendPropertyChangedEvent(const std::string &property,
   sendEvent(event);
 }
 
+void DeviceBase::sendPropertiesChangedEvent(const json &changes) {
+  EventMessage event("properties_changed");
+  event.setDeviceId(deviceId_);
+  event.setProperties(changes);
+
+  sendEvent(event);
+}
+
 void DeviceBase::initializeProperties() {
   std::lock_guard<std::mutex> lock(propertiesMutex_);
 
@@ -4,6 +4,8 @@
 #include <chrono>
 #include <thread>
 #include <random>
+#include <cstring>
+#include <stdexcept>
 
 namespace hydrogen {
 namespace device {
@@ -177,6 +179,21 @@ std::vector<uint8_t> Camera::getImageData() const {
     return imageData_;
 }
 
+size_t Camera::getImageDataSize() const {
+    std::lock_guard<std::mutex> lock(imageDataMutex_);
+    return imageData_.size();
+}
+
+size_t Camera::copyImageData(uint8_t* dst, size_t capacity) const {
+    std::lock_guard<std::mutex> lock(imageDataMutex_);
+    if (imageData_.size() > capacity) {
+        throw std::length_error("Image buffer too small: need " +
+                                std::to_string(imageData_.size()) + " bytes");
+    }
+    std::memcpy(dst, imageData_.data(), imageData_.size());
+    return imageData_.size();
+}
+
 void Camera::setGain(int gain) {
     if (gain < 0 || gain > cameraParams_.maxGain) {
         SPDLOG_ERROR("Camera {} invalid gain value: {}", getDeviceId(), gain);
@@ -121,6 +121,20 @@ public:
   void stopExposure() override;
   bool isExposing() const override;
   std::vector<uint8_t> getImageData() const override;
+
+  /**
+   * @brief Get the size of the current image in bytes (0 if none)
+   */
+  size_t getImageDataSize() const;
+
+  /**
+   * @brief Copy the current image into a caller-owned buffer
+   * @param dst Destination buffer
+   * @param capacity Size of the destination buffer in bytes
+   * @return Number of bytes copied (0 if there is no image)
+   * @throws std::length_error if the buffer is too small
+   */
+  size_t copyImageData(uint8_t* dst, size_t capacity) const;
   void setGain(int gain) override;
   int getGain() const override;
   bool setROI(int x, int y, int width, int height) override;
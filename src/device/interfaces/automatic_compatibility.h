@@ -94,11 +94,15 @@ inline void disableAutomaticCompatibility(const std::string& deviceId) {
  * @param enableASCOM Enable ASCOM protocol support globally
  * @param enableINDI Enable INDI protocol support globally
  * @param indiBasePort Base port for INDI servers (incremented for each device)
+ * @param singleIssuer One caller registers every device; sync all bridges
+ *        (and run discovery, if enabled) from one shared thread instead of
+ *        one thread per device
  */
 inline void initializeCompatibilitySystem(bool enableAutoDiscovery = true,
                                          bool enableASCOM = true,
                                          bool enableINDI = true,
-                                         int indiBasePort = 7624) {
+                                         int indiBasePort = 7624,
+                                         bool singleIssuer = false) {
     
     integration::IntegrationConfiguration config;
     config.autoDiscovery = enableAutoDiscovery;
@@ -107,6 +111,7 @@ inline void initializeCompatibilitySystem(bool enableAutoDiscovery = true,
     config.enableINDI = enableINDI;
     config.indiBasePort = indiBasePort;
     config.deviceNamePrefix = "Hydrogen_";
+    config.singleIssuer = singleIssuer;
     
     auto& manager = integration::AutomaticIntegrationManager::getInstance();
     manager.initialize(config);
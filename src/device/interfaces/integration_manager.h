@@ -36,6 +36,7 @@ struct IntegrationConfiguration {
     bool enableASCOM = true;
     bool enableINDI = true;
     int discoveryInterval = 5000; // milliseconds
+    bool singleIssuer = false; // One caller registers all devices: one shared thread syncs bridges (and discovers, if enabled)
     int indiBasePort = 7624;
     std::string deviceNamePrefix = "Hydrogen_";
     std::unordered_map<std::string, bridge::BridgeConfiguration> deviceConfigs;
@@ -58,6 +59,7 @@ public:
     
     // Manager lifecycle
     void initialize(const IntegrationConfiguration& config = IntegrationConfiguration()) {
+        std::lock_guard<std::mutex> lock(lifecycleMutex_);
         if (initialized_.load()) return;
         
         config_ = config;
@@ -67,11 +69,14 @@ public:
     }
     
     void start() {
+        std::lock_guard<std::mutex> lock(lifecycleMutex_);
         if (running_.load()) return;
         
         running_ = true;
         
-        if (config_.autoDiscovery) {
+        if (config_.singleIssuer) {
+            syncThread_ = std::thread(&AutomaticIntegrationManager::synchronizationLoop, this);
+        } else if (config_.autoDiscovery) {
             discoveryThread_ = std::thread(&AutomaticIntegrationManager::discoveryLoop, this);
         }
         
@@ -79,6 +84,7 @@ public:
     }
     
     void stop() {
+        std::lock_guard<std::mutex> lock(lifecycleMutex_);
         if (!running_.load()) return;
         
         running_ = false;
@@ -87,6 +93,9 @@ public:
         if (discoveryThread_.joinable()) {
             discoveryThread_.join();
         }
+        if (syncThread_.joinable()) {
+            syncThread_.join();
+        }
         
         // Stop all bridges
         stopAllBridges();
@@ -122,6 +131,7 @@ public:
             bridgeConfig.enableASCOM = config_.enableASCOM;
             bridgeConfig.enableINDI = config_.enableINDI;
         }
+        bridgeConfig.ownSyncThread = bridgeConfig.ownSyncThread && !config_.singleIssuer;
         
         // Create and start bridge
         auto bridge = bridge::ProtocolBridgeFactory::createAndStartBridge(device, bridgeConfig);
@@ -137,6 +147,7 @@ public:
         info.bridge = std::static_pointer_cast<void>(bridge);
         info.deviceType = getDeviceTypeName<DeviceType>();
         info.registrationTime = std::chrono::system_clock::now();
+        info.synchronize = [bridge]() { bridge->synchronizeProperties(); };
         
         registeredDevices_[deviceId] = info;
         
@@ -268,8 +279,11 @@ private:
         std::shared_ptr<void> bridge; // Type-erased bridge pointer
         std::string deviceType;
         std::chrono::system_clock::time_point registrationTime;
+        std::function<void()> synchronize;
     };
     
+    // Serializes initialize/start/stop, which write config_ and the threads
+    std::mutex lifecycleMutex_;
     std::atomic<bool> initialized_{false};
     std::atomic<bool> running_{false};
     IntegrationConfiguration config_;
@@ -281,6 +295,7 @@ private:
     
     // Discovery
     std::thread discoveryThread_;
+    std::thread syncThread_; // Shared property sync (single-issuer mode)
     
     // Callbacks
     mutable std::mutex callbacksMutex_;
@@ -314,6 +329,42 @@ private:
         SPDLOG_DEBUG("Device discovery loop stopped");
     }
     
+    void synchronizationLoop() {
+        SPDLOG_DEBUG("Shared property synchronization loop started");
+        
+        // Discovery, when enabled, runs on this same thread at its own interval
+        auto nextDiscovery = std::chrono::steady_clock::now();
+        
+        while (running_.load()) {
+            try {
+                if (config_.autoDiscovery && std::chrono::steady_clock::now() >= nextDiscovery) {
+                    discoverDevices();
+                    nextDiscovery = std::chrono::steady_clock::now() +
+                                    std::chrono::milliseconds(config_.discoveryInterval);
+                }
+                
+                std::vector<std::function<void()>> syncs;
+                {
+                    std::lock_guard<std::mutex> lock(devicesMutex_);
+                    syncs.reserve(registeredDevices_.size());
+                    for (const auto& [deviceId, info] : registeredDevices_) {
+                        if (info.synchronize) {
+                            syncs.push_back(info.synchronize);
+                        }
+                    }
+                }
+                for (const auto& sync : syncs) {
+                    sync();
+                }
+                std::this_thread::sleep_for(std::chrono::milliseconds(500));
+            } catch (const std::exception& e) {
+                SPDLOG_ERROR("Error in shared synchronization loop: {}", e.what());
+            }
+        }
+        
+        SPDLOG_DEBUG("Shared property synchronization loop stopped");
+    }
+    
     void discoverDevices() {
         // In real implementation, would scan for new devices
         // This could involve:
@@ -36,6 +36,7 @@ struct BridgeConfiguration {
     int indiPort = 7624;
     bool autoRegisterCOM = true;
     bool autoStartServers = true;
+    bool ownSyncThread = true; // false: the owner calls synchronizeProperties()
     std::string deviceName;
     std::string deviceDescription;
     std::unordered_map<std::string, std::string> customProperties;
@@ -95,7 +96,9 @@ public:
         }
         
         // Start property synchronization
-        syncThread_ = std::thread(&TransparentProtocolBridge::synchronizationLoop, this);
+        if (config_.ownSyncThread) {
+            syncThread_ = std::thread(&TransparentProtocolBridge::synchronizationLoop, this);
+        }
         
         SPDLOG_INFO("Transparent protocol bridge started for device: {}", config_.deviceName);
     }
@@ -121,6 +124,11 @@ public:
         SPDLOG_INFO("Transparent protocol bridge stopped for device: {}", config_.deviceName);
     }
     
+    // Push all internal properties to the enabled protocols once
+    void synchronizeProperties() {
+        synchronizeAllProperties();
+    }
+    
     // Protocol registration
     void registerWithProtocols() {
         if (config_.enableASCOM) {
@@ -272,6 +272,17 @@ bool ObservingConditions::isSafeToObserve() const {
     return safeToObserve_.load();
 }
 
+json ObservingConditions::getSnapshot() const {
+    // Current averaged readings plus safety state in a single call
+    return {
+        {"temperature", sensors_.at("Temperature").averageValue.load()},
+        {"humidity", sensors_.at("Humidity").averageValue.load()},
+        {"wind_speed", sensors_.at("WindSpeed").averageValue.load()},
+        {"cloud_cover", sensors_.at("CloudCover").averageValue.load()},
+        {"safe", safeToObserve_.load()}
+    };
+}
+
 std::vector<std::string> ObservingConditions::getActiveAlerts() const {
     std::lock_guard<std::mutex> lock(alertsMutex_);
     return activeAlerts_;
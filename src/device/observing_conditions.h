@@ -92,6 +92,7 @@ public:
     void setSafetyLimits(const json& limits);
     json getSafetyLimits() const;
     bool isSafeToObserve() const;
+    json getSnapshot() const;
     std::vector<std::string> getActiveAlerts() const;
     void setAlertThresholds(const json& thresholds);
     
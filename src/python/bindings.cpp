@@ -1,9 +1,7 @@
 #include <pybind11/chrono.h>
 #include <pybind11/functional.h>
-#include <pybind11/numpy.h>
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
-#include <pybind11/stl_bind.h>
 
 #include <hydrogen/core.h>
 #include <hydrogen/device.h>
@@ -45,9 +43,24 @@ using namespace hydrogen::server;
 using namespace hydrogen::device::interfaces;
 
 // 定义模块名为 pyhydrogen
+// Free-threaded CPython (3.13t) defines Py_GIL_DISABLED; declare that the
+// module does not rely on the GIL so importing it does not re-enable it.
+// py::mod_gil_not_used() first appeared in pybind11 2.13; older releases
+// keep the default, and the interpreter re-enables the GIL on import.
+#if defined(Py_GIL_DISABLED) && PYBIND11_VERSION_HEX >= 0x020D0000
+PYBIND11_MODULE(pyhydrogen, m, py::mod_gil_not_used()) {
+#else
 PYBIND11_MODULE(pyhydrogen, m) {
+#endif
   m.doc() = "Python bindings for Astronomy Device Communication Protocol";
 
+  // 网络后端在编译期选择（HYDROGEN_ENABLE_IO_URING）
+#if defined(BOOST_ASIO_HAS_IO_URING) && defined(BOOST_ASIO_DISABLE_EPOLL)
+  m.attr("transport") = "io_uring";
+#else
+  m.attr("transport") = "default";
+#endif
+
   // 设置 spdlog 格式和级?
   m.def(
       "set_log_level",
@@ -70,6 +83,19 @@ PYBIND11_MODULE(pyhydrogen, m) {
       },
       "Set the log level for spdlog");
 
+  // 热路径上先判断级别，再格式化日志消息
+  m.def(
+      "log_enabled",
+      [](const std::string &level) {
+        auto lvl = spdlog::level::from_str(level);
+        if (lvl == spdlog::level::off && level != "off") {
+          throw std::invalid_argument("Invalid log level");
+        }
+        return spdlog::default_logger_raw()->should_log(lvl);
+      },
+      py::arg("level"),
+      "Check whether messages at the given level would be logged");
+
   // 工具函数
   m.def("generate_uuid", &generateUuid, "Generate a UUID string");
   m.def("get_iso_timestamp", &getIsoTimestamp,
@@ -218,22 +244,43 @@ PYBIND11_MODULE(pyhydrogen, m) {
                     const std::string &, const std::string &>(),
            py::arg("device_id"), py::arg("device_type"),
            py::arg("manufacturer"), py::arg("model"))
+      // Calls that block on network I/O or emit events release the GIL so
+      // Python worker threads keep running; command handlers re-acquire it
       .def("connect", &DeviceBase::connect, py::arg("host"), py::arg("port"),
-           "Connect to server")
-      .def("disconnect", &DeviceBase::disconnect, "Disconnect from server")
+           py::call_guard<py::gil_scoped_release>(), "Connect to server")
+      .def("disconnect", &DeviceBase::disconnect,
+           py::call_guard<py::gil_scoped_release>(), "Disconnect from server")
       .def("register_device", &DeviceBase::registerDevice,
+           py::call_guard<py::gil_scoped_release>(),
            "Register device with server")
-      .def("start", &DeviceBase::start, "Start the device")
-      .def("stop", &DeviceBase::stop, "Stop the device")
-      .def("run", &DeviceBase::run, "Run the message loop")
+      .def("start", &DeviceBase::start,
+           py::call_guard<py::gil_scoped_release>(), "Start the device")
+      .def("stop", &DeviceBase::stop,
+           py::call_guard<py::gil_scoped_release>(), "Stop the device")
+      .def("run", &DeviceBase::run, py::call_guard<py::gil_scoped_release>(),
+           "Run the message loop")
       .def("get_device_id", &DeviceBase::getDeviceId, "Get the device ID")
       .def("get_device_type", &DeviceBase::getDeviceType, "Get the device type")
       .def("get_device_info", &DeviceBase::getDeviceInfo,
            "Get device information as JSON")
       .def("set_property", &DeviceBase::setProperty, py::arg("property"),
-           py::arg("value"), "Set a device property")
+           py::arg("value"), py::call_guard<py::gil_scoped_release>(),
+           "Set a device property")
+      .def("set_properties", &DeviceBase::setProperties,
+           py::arg("properties"), py::call_guard<py::gil_scoped_release>(),
+           "Set multiple device properties with a single change notification")
+      .def("get_property_handle", &DeviceBase::getPropertyHandle,
+           py::arg("property"),
+           "Resolve a property name to a handle for set_property_by_handle")
+      .def("set_property_by_handle", &DeviceBase::setPropertyByHandle,
+           py::arg("handle"), py::arg("value"),
+           py::call_guard<py::gil_scoped_release>(),
+           "Set a device property through a pre-resolved handle")
       .def("get_property", &DeviceBase::getProperty, py::arg("property"),
            "Get a device property")
+      .def("get_properties", &DeviceBase::getProperties,
+           py::arg("properties"), py::call_guard<py::gil_scoped_release>(),
+           "Get several device properties as a dict in one call")
       .def(
           "register_command_handler",
           [](DeviceBase &device, const std::string &command,
@@ -254,7 +301,33 @@ PYBIND11_MODULE(pyhydrogen, m) {
                 });
           },
           py::arg("command"), py::arg("callback"),
-          "Register a Python function as command handler");
+          "Register a Python function as command handler")
+      .def(
+          "register_property_listener",
+          [](DeviceBase &device, const std::string &property,
+             py::function callback) {
+            // The listener is copied and destroyed by set_property* calls
+            // that run without the GIL, so only the shared_ptr is copied
+            // there and the Python callable is released under the GIL
+            std::shared_ptr<py::function> shared_callback(
+                new py::function(std::move(callback)), [](py::function *f) {
+                  py::gil_scoped_acquire acquire;
+                  delete f;
+                });
+            device.registerPropertyListener(
+                property, [shared_callback](const std::string &name,
+                                            const json &value) {
+                  py::gil_scoped_acquire acquire;
+                  try {
+                    (*shared_callback)(name, value);
+                  } catch (const py::error_already_set &e) {
+                    SPDLOG_ERROR("Python error in property listener: {}",
+                                 e.what());
+                  }
+                });
+          },
+          py::arg("property"), py::arg("callback"),
+          "Register a Python function called with (name, value) whenever the property is set");
 
   // 添加观测事件和异步处理的回调机制
   m.def(
@@ -332,6 +405,7 @@ PYBIND11_MODULE(pyhydrogen, m) {
       .def("stop_exposure", &Camera::stopExposure,
            "Stop the current exposure")
       .def("get_camera_state", &Camera::getCameraState,
+           py::call_guard<py::gil_scoped_release>(),
            "Get the current camera state")
       .def("get_image_ready", &Camera::getImageReady,
            "Check if image is ready for download")
@@ -428,7 +502,29 @@ PYBIND11_MODULE(pyhydrogen, m) {
       .def("get_image_array_variant", &Camera::getImageArrayVariant,
            "Get the image data as a variant (JSON)")
       .def("get_image_data", &Camera::getImageData,
+           py::call_guard<py::gil_scoped_release>(),
            "Get the raw image data as bytes")
+      .def("get_image_data_size", &Camera::getImageDataSize,
+           py::call_guard<py::gil_scoped_release>(),
+           "Get the size of the current image in bytes")
+      .def(
+          "read_image_into",
+          [](const Camera &self, py::buffer out) {
+            py::buffer_info info = out.request(true);
+            // Only C-contiguous buffers can be filled with a single copy
+            py::ssize_t stride = info.itemsize;
+            for (py::ssize_t dim = info.ndim - 1; dim >= 0; --dim) {
+              if (info.strides[dim] != stride) {
+                throw py::value_error("read_image_into requires a C-contiguous buffer");
+              }
+              stride *= info.shape[dim];
+            }
+            py::gil_scoped_release release;
+            return self.copyImageData(static_cast<uint8_t *>(info.ptr),
+                                      static_cast<size_t>(info.size * info.itemsize));
+          },
+          py::arg("out"),
+          "Copy the current image into a preallocated writable buffer (e.g. a numpy array); returns bytes copied")
 
       // ===== Sensor Information (ASCOM Standard) =====
       .def("get_sensor_type", &Camera::getSensorType,
@@ -513,8 +609,10 @@ PYBIND11_MODULE(pyhydrogen, m) {
 
       // ===== Coordinate Properties (ASCOM Standard) =====
       .def("get_right_ascension", &Telescope::getRightAscension,
+           py::call_guard<py::gil_scoped_release>(),
            "Get the current right ascension in hours")
       .def("get_declination", &Telescope::getDeclination,
+           py::call_guard<py::gil_scoped_release>(),
            "Get the current declination in degrees")
       .def("get_altitude", &Telescope::getAltitude,
            "Get the current altitude in degrees")
@@ -701,12 +799,15 @@ PYBIND11_MODULE(pyhydrogen, m) {
 
       // ===== Position Control (ASCOM Standard) =====
       .def("get_position", &Focuser::getPosition,
+           py::call_guard<py::gil_scoped_release>(),
            "Get the current focuser position")
       .def("move", &Focuser::move, py::arg("position"),
+           py::call_guard<py::gil_scoped_release>(),
            "Move the focuser to the specified absolute position")
       .def("move_relative", &Focuser::moveRelative, py::arg("steps"),
+           py::call_guard<py::gil_scoped_release>(),
            "Move the focuser by the specified number of steps")
-      .def("halt", &Focuser::halt,
+      .def("halt", &Focuser::halt, py::call_guard<py::gil_scoped_release>(),
            "Halt focuser movement immediately")
       .def("get_is_moving", &Focuser::getIsMoving,
            "Check if the focuser is currently moving")
@@ -749,7 +850,9 @@ PYBIND11_MODULE(pyhydrogen, m) {
       .def("get_temperature", &ObservingConditions::getTemperature, "Get ambient temperature")
       .def("get_wind_direction", &ObservingConditions::getWindDirection, "Get wind direction")
       .def("get_wind_gust", &ObservingConditions::getWindGust, "Get wind gust speed")
-      .def("get_wind_speed", &ObservingConditions::getWindSpeed, "Get wind speed");
+      .def("get_wind_speed", &ObservingConditions::getWindSpeed, "Get wind speed")
+      .def("get_snapshot", &ObservingConditions::getSnapshot,
+           "Get temperature, humidity, wind speed, cloud cover and safety state in one call");
 
   // Safety Monitor device bindings
   py::class_<SafetyMonitor, DeviceBase, std::shared_ptr<SafetyMonitor>>(m, "SafetyMonitor")
@@ -797,6 +900,7 @@ PYBIND11_MODULE(pyhydrogen, m) {
   m.def("init_compatibility_system", &compatibility::initializeCompatibilitySystem,
         py::arg("enable_auto_discovery") = true, py::arg("enable_ascom") = true,
         py::arg("enable_indi") = true, py::arg("indi_base_port") = 7624,
+        py::arg("single_issuer") = false,
         "Initialize the automatic ASCOM/INDI compatibility system");
 
   m.def("shutdown_compatibility_system", &compatibility::shutdownCompatibilitySystem,
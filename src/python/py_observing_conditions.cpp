@@ -1,7 +1,5 @@
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
-#include <pybind11/chrono.h>
-#include <pybind11/functional.h>
 
 #include "../device/observing_conditions.h"
 #include "../device/interfaces/automatic_compatibility.h"
@@ -166,6 +164,8 @@ void bind_observing_conditions(py::module& m) {
         .def("get_overall_condition", &ObservingConditions::getOverallCondition, "Get overall weather condition")
         .def("is_safe_for_observing", &ObservingConditions::isSafeForObserving, "Check if conditions are safe for observing")
         .def("get_safety_score", &ObservingConditions::getSafetyScore, "Get safety score (0-100)")
+        .def("get_snapshot", &ObservingConditions::getSnapshot,
+             "Get temperature, humidity, wind speed, cloud cover and safety state in one call")
         
         // Thresholds and limits
         .def("set_safety_threshold", &ObservingConditions::setSafetyThreshold, 
@@ -1,9 +1,5 @@
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
-#include <pybind11/chrono.h>
-#include <pybind11/functional.h>
-#include <pybind11/numpy.h>
-#include <pybind11/operators.h>
 
 #include "../device/interfaces/device_interface.h"
 #include "../device/interfaces/automatic_compatibility.h"
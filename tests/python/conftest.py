@@ -0,0 +1,19 @@
+"""
+pytest configuration for the Hydrogen Python binding tests.
+
+The tests import ``pyhydrogen`` directly. Install it with ``python/setup.py``
+(or point ``PYTHONPATH`` at the build tree); as a fallback the default
+``build/`` directory is put on ``sys.path`` once per test process.
+"""
+
+import importlib.util
+import os
+import sys
+
+BUILD_DIR = os.path.normpath(os.path.join(os.path.dirname(__file__), '../../build'))
+
+
+def pytest_configure(config):
+    """Make an uninstalled in-tree build of pyhydrogen importable"""
+    if importlib.util.find_spec("pyhydrogen") is None and BUILD_DIR not in sys.path:
+        sys.path.append(BUILD_DIR)